@@ -0,0 +1,43 @@
+"""Add job_post.content_hash for exact-content duplicate detection.
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f6a7b8c9d0e1"
+down_revision = "e5f6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_post",
+        sa.Column("content_hash", sa.String(64), nullable=True),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        op.create_index(
+            "ix_job_post_content_hash", "job_post", ["content_hash"], unique=False
+        )
+        return
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_job_post_content_hash
+            ON job_post (content_hash)
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_post_content_hash", table_name="job_post")
+    op.drop_column("job_post", "content_hash")
@@ -1,7 +1,8 @@
+import json
 from collections import Counter
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session, joinedload
 from pydantic import BaseModel
 
@@ -144,10 +145,18 @@ async def get_subscription_plans(
     current_user: User = Depends(get_current_user),
 ):
     """List available subscription plans for authenticated users."""
-    return {
-        "plans": subscription_service.list_plans(),
-        "current_tier": current_user.subscription_tier,
-    }
+    # The plan catalog is static, so splice its cached JSON instead of
+    # re-encoding it on every request.
+    content = b"".join(
+        (
+            b'{"plans":',
+            subscription_service.list_plans_json(),
+            b',"current_tier":',
+            json.dumps(current_user.subscription_tier).encode("utf-8"),
+            b"}",
+        )
+    )
+    return Response(content=content, media_type="application/json")
 
 
 @router.post("/subscription/checkout")
@@ -1,9 +1,41 @@
 from celery import Celery
+from decimal import Decimal
 from .config import settings
 import logging
 
+try:
+    import orjson
+    from kombu.serialization import register as register_serializer
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Task arguments, results and state meta are encoded with orjson when it is
+# available; stdlib json stays accepted so messages from older producers
+# still decode during a rollout.
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _orjson_default(obj):
+        """Encode the few non-native types tasks pass; anything else raises."""
+        if isinstance(obj, Decimal):
+            return float(obj)
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    register_serializer(
+        "orjson",
+        lambda obj: orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS),
+        orjson.loads,
+        content_type="application/x-orjson",
+        content_encoding="utf-8",
+    )
+    _SERIALIZER = "orjson"
+else:
+    _SERIALIZER = "json"
+
 # Create Celery instance
 celery_app = Celery(
     "nextstep_workflows",
@@ -15,14 +47,15 @@ celery_app = Celery(
         "app.tasks.gov_monitor_tasks",
         "app.tasks.processing_tasks",
         "app.tasks.pipeline_tasks",
+        "app.tasks.notification_tasks",
     ],
 )
 
 # Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer=_SERIALIZER,
+    accept_content=["orjson", "json"],
+    result_serializer=_SERIALIZER,
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
@@ -31,6 +64,9 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
     result_expires=3600,  # 1 hour
+    # The Redis result backend is shared by the threads-pool I/O worker; let
+    # its threads reuse one backend client instead of opening one each.
+    result_backend_thread_safe=True,
     beat_schedule={
         # Run complete workflow daily at 2 AM
         "daily-complete-workflow": {
@@ -88,9 +124,15 @@ celery_app.conf.update(
     task_routes={
         "app.tasks.workflow_tasks.*": {"queue": "workflow"},
         "app.tasks.scraper_tasks.*": {"queue": "scrapers"},
+        # Post-processing of fetched government posts is CPU work: send it to
+        # the prefork processing worker, not the threads-pool scrapers one.
+        "app.tasks.gov_monitor_tasks.process_government_posts_batch": {
+            "queue": "processing"
+        },
         "app.tasks.gov_monitor_tasks.*": {"queue": "scrapers"},
         "app.tasks.processing_tasks.*": {"queue": "processing"},
         "app.tasks.pipeline_tasks.*": {"queue": "workflow"},
+        "app.tasks.notification_tasks.*": {"queue": "workflow"},
     },
 )
 
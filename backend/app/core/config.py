@@ -99,6 +99,8 @@ class Settings(BaseModel):
     EMBEDDING_PROVIDER: str = os.getenv("EMBEDDING_PROVIDER", "sentence-transformers")
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
     EMBEDDING_DIM: int = int(os.getenv("EMBEDDING_DIM", "384"))
+    # Optional text-embeddings-inference server; batch jobs use it when set.
+    EMBEDDING_SERVICE_URL: str = os.getenv("EMBEDDING_SERVICE_URL", "")
 
     # Skill Extraction
     SKILL_EXTRACTOR_MODE: str = os.getenv("SKILL_EXTRACTOR_MODE", "skillner")
@@ -158,6 +160,11 @@ class Settings(BaseModel):
     CELERY_RESULT_BACKEND: str = os.getenv(
         "CELERY_RESULT_BACKEND", "redis://localhost:6379/0"
     )
+    # Intermediate PROGRESS states cost a result-backend write each; off by
+    # default since nothing polls them in normal operation.
+    CELERY_TRACK_PROGRESS: bool = (
+        os.getenv("CELERY_TRACK_PROGRESS", "false").lower() == "true"
+    )
 
     # File Storage
     UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "uploads")
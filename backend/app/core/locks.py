@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import functools
 import logging
 import uuid
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Any, Callable, Iterator
 
 from .config import settings
 
@@ -16,6 +17,27 @@ end
 return 0
 """
 
+_client = None
+_release_script = None
+
+
+def get_redis_client():
+    """Process-wide Redis client so lock calls reuse one connection pool."""
+    global _client
+    if _client is None:
+        import redis  # Imported lazily to keep import-time side effects minimal.
+
+        _client = redis.Redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+def _get_release_script():
+    """Release script registered once and invoked via EVALSHA afterwards."""
+    global _release_script
+    if _release_script is None:
+        _release_script = get_redis_client().register_script(_RELEASE_LOCK_LUA)
+    return _release_script
+
 
 @contextmanager
 def redis_lock(key: str, *, ttl_seconds: int) -> Iterator[bool]:
@@ -25,21 +47,48 @@ def redis_lock(key: str, *, ttl_seconds: int) -> Iterator[bool]:
     If Redis is unavailable, yields True (fail-open) and logs a warning.
     """
     token = uuid.uuid4().hex
+    # Only acquisition is fail-open; exceptions raised by the caller's block
+    # must propagate untouched, so the yield sits outside this try.
     try:
-        import redis  # Imported lazily to keep import-time side effects minimal.
+        client = get_redis_client()
+        # Single-shot SET NX PX; the random token acts as the fencing value
+        # checked by the release script, so no heartbeat is needed.
+        acquired = bool(client.set(key, token, nx=True, px=int(ttl_seconds * 1000)))
+        held = acquired
+    except Exception as exc:  # pragma: no cover
+        logger.warning("Redis unavailable; proceeding without lock (%s): %s", key, exc)
+        acquired, held = True, False
 
-        client = redis.Redis.from_url(settings.REDIS_URL)
-        acquired = bool(client.set(key, token, nx=True, ex=int(ttl_seconds)))
-        if not acquired:
-            yield False
-            return
-        try:
-            yield True
-        finally:
+    try:
+        yield acquired
+    finally:
+        if held:
             try:
-                client.eval(_RELEASE_LOCK_LUA, 1, key, token)
+                _get_release_script()(keys=[key], args=[token])
             except Exception as exc:  # pragma: no cover
                 logger.warning("Failed to release redis lock %s: %s", key, exc)
-    except Exception as exc:  # pragma: no cover
-        logger.warning("Redis unavailable; proceeding without lock (%s): %s", key, exc)
-        yield True
+
+
+def skip_if_running(lock_key: str, *, ttl_seconds: int) -> Callable:
+    """Run the decorated task body under `redis_lock(lock_key)`.
+
+    A second invocation that starts while the first still holds the lock
+    returns a "skipped" result instead of repeating the work. Place it below
+    `@celery_app.task` so it wraps the plain function.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with redis_lock(lock_key, ttl_seconds=ttl_seconds) as acquired:
+                if not acquired:
+                    logger.info("Skipping %s: %s is held", func.__name__, lock_key)
+                    return {
+                        "status": "skipped",
+                        "reason": f"lock_not_acquired:{lock_key}",
+                    }
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,20 +1,71 @@
+import json
+from contextlib import asynccontextmanager
+from decimal import Decimal
+
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from ..core.config import settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 # Use centralized settings for DATABASE_URL
 DATABASE_URL = settings.DATABASE_URL
 
+
+def _json_default(obj):
+    """Encode values neither orjson nor stdlib json handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if hasattr(obj, "tolist"):  # numpy scalars and arrays
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_serializer(obj) -> str:
+    try:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode("utf-8")
+    except orjson.JSONEncodeError:
+        # e.g. ints wider than 64 bits, which only stdlib json encodes
+        return json.dumps(obj, default=_json_default)
+
+
+# JSON/JSONB columns (notification payloads, meta_json, ...) are encoded with
+# orjson when available; it is several times faster than stdlib json.
+if orjson is not None:
+    _JSON_ENGINE_KWARGS = {
+        "json_serializer": _orjson_serializer,
+        "json_deserializer": orjson.loads,
+    }
+else:
+    _JSON_ENGINE_KWARGS = {
+        "json_serializer": lambda obj: json.dumps(obj, default=_json_default)
+    }
+
 # Support async engines when DATABASE_URL indicates an async dialect
 if "+async" in DATABASE_URL or DATABASE_URL.startswith("sqlite+aiosqlite"):
     from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 
-    engine = create_async_engine(DATABASE_URL, future=True)
+    engine = create_async_engine(DATABASE_URL, future=True, **_JSON_ENGINE_KWARGS)
     SessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    TaskSessionLocal = sessionmaker(
+        engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
     USE_ASYNC = True
 else:
-    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    engine = create_engine(DATABASE_URL, pool_pre_ping=True, **_JSON_ENGINE_KWARGS)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # Background jobs commit in chunks and never read ORM state back after a
+    # commit, so skipping expiry avoids reloading every touched row.
+    TaskSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+    )
     USE_ASYNC = False
 
 # If using SQLite for tests, create all tables automatically to avoid requiring
@@ -44,45 +95,47 @@ def init_db():
     Base.metadata.create_all(bind=engine)
 
 
-async def get_db():
-    """Async generator that yields a Session compatible with sync + async usage.
+class _HybridResult:
+    def __init__(self, result):
+        self._result = result
 
-    Some tests use `async for db in get_db()` and `await db.execute(...)`,
-    while the API code expects sync-style `db.execute(...)`. The hybrid wrapper
-    supports both without forcing async engines.
-    """
+    def __await__(self):
+        async def _wrap():
+            return self._result
 
-    class _HybridResult:
-        def __init__(self, result):
-            self._result = result
+        return _wrap().__await__()
 
-        def __await__(self):
-            async def _wrap():
-                return self._result
+    def __getattr__(self, item):
+        return getattr(self._result, item)
 
-            return _wrap().__await__()
 
-        def __getattr__(self, item):
-            return getattr(self._result, item)
+class _HybridSession:
+    def __init__(self, sync_session):
+        self._session = sync_session
 
-    class _HybridSession:
-        def __init__(self, sync_session):
-            self._session = sync_session
+    def execute(self, *args, **kwargs):
+        return _HybridResult(self._session.execute(*args, **kwargs))
 
-        def execute(self, *args, **kwargs):
-            return _HybridResult(self._session.execute(*args, **kwargs))
+    def commit(self):
+        return _HybridResult(self._session.commit())
 
-        def commit(self):
-            return _HybridResult(self._session.commit())
+    def rollback(self):
+        return _HybridResult(self._session.rollback())
 
-        def rollback(self):
-            return _HybridResult(self._session.rollback())
+    def close(self):
+        return _HybridResult(self._session.close())
 
-        def close(self):
-            return _HybridResult(self._session.close())
+    def __getattr__(self, item):
+        return getattr(self._session, item)
+
+
+async def get_db():
+    """Async generator that yields a Session compatible with sync + async usage.
 
-        def __getattr__(self, item):
-            return getattr(self._session, item)
+    Some tests use `async for db in get_db()` and `await db.execute(...)`,
+    while the API code expects sync-style `db.execute(...)`. The hybrid wrapper
+    supports both without forcing async engines.
+    """
 
     # Ensure tables exist for SQLite in this process before yielding session
     if DATABASE_URL.startswith("sqlite"):
@@ -108,3 +161,33 @@ async def get_db():
         yield _HybridSession(db)
     finally:
         db.close()
+
+
+@asynccontextmanager
+async def session_scope():
+    """Session for background jobs, drawn from the process-wide engine pool.
+
+    Unlike `get_db()` this skips the per-call SQLite `create_all` probe; tables
+    are created once at import. Sessions neither autoflush nor expire on
+    commit, and are otherwise the same types `get_db()` yields.
+    """
+    if USE_ASYNC:
+        async with TaskSessionLocal() as async_db:
+            yield async_db
+        return
+
+    db = TaskSessionLocal()
+    try:
+        yield _HybridSession(db)
+    finally:
+        db.close()
+
+
+def dispose_engine_after_fork() -> None:
+    """Drop pooled connections inherited from a parent process.
+
+    Call from a forked worker before first use; the parent keeps its
+    connections and the child opens its own on demand.
+    """
+    sync_engine = engine.sync_engine if USE_ASYNC else engine
+    sync_engine.dispose(close=False)
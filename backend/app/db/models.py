@@ -83,6 +83,8 @@ class JobPost(Base):
     source_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     application_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     url_hash: Mapped[str | None] = mapped_column(String(32), index=True)
+    # sha256 of the whitespace-normalized title + description (exact dupes)
+    content_hash: Mapped[str | None] = mapped_column(String(64), index=True)
     first_seen: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     last_seen: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     repost_count: Mapped[int] = mapped_column(Integer, default=0)
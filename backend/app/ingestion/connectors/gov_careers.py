@@ -65,6 +65,9 @@ GENERIC_LINK_TEXT = {
 DOCUMENT_EXTENSIONS = (".pdf", ".doc", ".docx")
 MAX_DESCRIPTION_CHARS = 4000
 MAX_DOCUMENT_BYTES = 8 * 1024 * 1024
+# Commit new postings in batches so a large scrape never holds thousands of
+# pending rows in the session before the final commit.
+WRITE_BATCH_SIZE = 100
 
 _NON_JOB_HINTS = (
     "tender",
@@ -567,6 +570,8 @@ def ingest_gov_careers(db: Session, **src) -> int:
                 )
                 db.add(jp)
                 added += 1
+                if added % WRITE_BATCH_SIZE == 0:
+                    db.commit()
 
             if not matched_links and context_has_keyword and not is_list_doc:
                 if not _has_keyword(page_text.lower(), NEGATIVE_KEYWORDS):
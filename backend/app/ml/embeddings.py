@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import logging
 import os
@@ -13,6 +14,11 @@ from .model_registry import (
 
 logger = logging.getLogger(__name__)
 
+# Stored vectors are rounded to this many decimals. Unit-norm components keep
+# roughly half-precision accuracy while the JSON payload shrinks ~3x versus
+# full float64 reprs.
+EMBEDDING_STORE_DECIMALS = 4
+
 # Global model instances (lazy loaded)
 _tokenizer = None
 _transformer_model = None
@@ -135,6 +141,45 @@ def generate_embeddings(texts: list[str]) -> list[list[float]]:
     return [embed_text(t) for t in texts]
 
 
+# Texts per request to a remote embedding server; requests are sent
+# concurrently and the server batches them dynamically.
+REMOTE_EMBED_BATCH_SIZE = 64
+
+
+async def generate_embeddings_remote(
+    texts: list[str],
+    base_url: str,
+    batch_size: int = REMOTE_EMBED_BATCH_SIZE,
+    timeout: float = 60.0,
+) -> list[list[float]]:
+    """Generate embeddings via a text-embeddings-inference ``/embed`` endpoint."""
+    import httpx
+
+    chunks = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+        responses = await asyncio.gather(
+            *(
+                client.post("/embed", json={"inputs": chunk, "truncate": True})
+                for chunk in chunks
+            )
+        )
+
+    vectors: list[list[float]] = []
+    for response in responses:
+        response.raise_for_status()
+        vectors.extend(response.json())
+    return vectors
+
+
+def compact_embeddings(
+    vectors: list[list[float]], decimals: int = EMBEDDING_STORE_DECIMALS
+) -> list[list[float]]:
+    """Round vectors to ``decimals`` places for storage in ``vector_json``."""
+    if not len(vectors):
+        return []
+    return np.round(np.asarray(vectors, dtype=np.float64), decimals).tolist()
+
+
 def update_embeddings_model(db=None) -> dict:
     """Placeholder for updating embedding model; no-op for now.
 
@@ -200,7 +245,7 @@ def run_incremental_embeddings(
         ids = [r[0] for r in rows]
         texts = [r[1] or "" for r in rows]
 
-        vectors = generate_embeddings(texts)
+        vectors = compact_embeddings(generate_embeddings(texts))
 
         for job_id, vec in zip(ids, vectors):
             db.add(
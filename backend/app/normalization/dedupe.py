@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
 from datetime import date, datetime
@@ -53,6 +54,14 @@ def build_title_company_date_key(
     return f"{title_key}|{company_key}|{seen_date.isoformat()}"
 
 
+def content_hash(title: str | None, description: str | None) -> str | None:
+    """SHA-256 of the lowercased, whitespace-normalized title + description."""
+    normalized = " ".join(f"{title or ''} {description or ''}".lower().split())
+    if not normalized:
+        return None
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 def get_shingles(text: str, k=5):
     """Generate k-shingles from text."""
     if not text:
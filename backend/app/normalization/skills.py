@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -153,6 +154,7 @@ def _pattern_enabled() -> bool:
     }
 
 
+@lru_cache(maxsize=4096)
 def _build_word_boundary_pattern(term: str) -> re.Pattern:
     return re.compile(rf"(?<!\w){re.escape(term)}(?!\w)", re.IGNORECASE)
 
@@ -202,10 +204,13 @@ def _upsert_skill_result(
 
 def _extract_pattern_matches(text: str) -> List[Dict[str, Any]]:
     matches = []
+    # A plain substring test rejects most needles far faster than a
+    # case-insensitive regex scan of the whole description.
+    lowered = text.lower()
     for skill, needles in SKILL_PATTERNS.items():
         for needle in needles:
             needle_clean = needle.strip()
-            if not needle_clean:
+            if not needle_clean or needle_clean.lower() not in lowered:
                 continue
             pattern = _build_word_boundary_pattern(needle_clean)
             match = pattern.search(text)
@@ -233,6 +238,8 @@ def _extract_custom_matches(text: str) -> List[Dict[str, Any]]:
             continue
         terms = [name] + [alias for alias in entry.get("aliases", []) if alias]
         for term in terms:
+            if term.lower() not in lowered:
+                continue
             pattern = _build_word_boundary_pattern(term)
             match = pattern.search(lowered)
             if not match:
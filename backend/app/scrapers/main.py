@@ -14,9 +14,13 @@ def scrape_site(
     *,
     use_postgres: bool | None = None,
     max_pages: int | None = None,
+    deadline: float | None = None,
 ) -> dict:
     """Scrape a specific site.
 
+    ``deadline`` is a ``time.monotonic()`` value; the spider finishes the
+    page in progress and stops once it passes.
+
     Returns a small result dict so callers (CLI, pipelines) can aggregate.
     """
     if site_name not in SITES:
@@ -27,7 +31,9 @@ def scrape_site(
 
     try:
         logging.info(f"Starting scrape for {site_name}")
-        spider = SiteSpider(site_name, use_postgres=use_postgres, max_pages=max_pages)
+        spider = SiteSpider(
+            site_name, use_postgres=use_postgres, max_pages=max_pages, deadline=deadline
+        )
         inserted = spider.run()
         logging.info(f"Successfully completed scraping {site_name}")
         return {"site": site_name, "status": "success", "inserted": inserted}
@@ -8,6 +8,7 @@ warnings.filterwarnings("ignore", category=NotOpenSSLWarning, module="urllib3")
 import argparse
 import logging
 import os
+import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from urllib.parse import urljoin
@@ -48,6 +49,7 @@ class SiteSpider:
         *,
         use_postgres: bool | None = None,
         max_pages: int | None = None,
+        deadline: float | None = None,
     ):
         cfg = get_site_cfg(site_name)
         self.base_url = cfg["base_url"]
@@ -60,6 +62,8 @@ class SiteSpider:
             use_postgres = USE_POSTGRES
         self.use_postgres = bool(use_postgres)
         self.max_pages = max_pages
+        # time.monotonic() value after which no further listing page is started
+        self.deadline = deadline
 
         self.session = get_session()
         if self.use_postgres:
@@ -119,6 +123,9 @@ class SiteSpider:
                 if self.max_pages is not None and page > self.max_pages:
                     logging.info("Reached max_pages=%s, stopping.", self.max_pages)
                     break
+                if self.deadline is not None and time.monotonic() >= self.deadline:
+                    logging.info("Reached deadline before page %s, stopping.", page)
+                    break
 
                 url = self.base_url + self.list_path.format(page=page)
                 resp = self.fetch(url)
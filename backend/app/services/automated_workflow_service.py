@@ -29,6 +29,8 @@ class AutomatedWorkflowService:
         self.job_processor = JobProcessor()
         self.learning_threshold = 100  # Minimum new jobs to trigger learning
         self.quality_threshold = 0.8  # Quality score threshold for auto-processing
+        # (config.yaml mtime_ns, parsed sites) from the last load.
+        self._scraper_configs_cache: tuple[int, Dict[str, Any]] | None = None
 
     async def run_complete_workflow(self, db: AsyncSession) -> Dict[str, Any]:
         """Run the complete automated workflow: scrape -> process -> learn -> optimize"""
@@ -304,8 +306,14 @@ class AutomatedWorkflowService:
 
         return stage_results
 
-    async def _test_scraper(self, site_name: str, config: Dict) -> Dict[str, Any]:
-        """Test individual scraper configuration"""
+    async def _test_scraper(
+        self, site_name: str, config: Dict, client: Any = None
+    ) -> Dict[str, Any]:
+        """Test individual scraper configuration
+
+        Pass a shared ``httpx.AsyncClient`` as ``client`` to reuse pooled
+        connections; otherwise a client is opened for this probe alone.
+        """
         test_result = {
             "site_name": site_name,
             "tested_at": datetime.utcnow(),
@@ -325,26 +333,29 @@ class AutomatedWorkflowService:
             # Test base URL connectivity
             test_url = f"{config['base_url']}{config['listing_path'].format(page=1)}"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            if client is None:
+                async with httpx.AsyncClient(timeout=30.0) as own_client:
+                    response = await own_client.get(test_url)
+            else:
                 response = await client.get(test_url)
-                test_result["response_time"] = time.time() - start_time
+            test_result["response_time"] = time.time() - start_time
 
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, "html.parser")
+            if response.status_code == 200:
+                soup = BeautifulSoup(response.content, "html.parser")
 
-                    # Test job listing selector
-                    job_links = soup.select(config["listing_selector"])
-                    test_result["sample_jobs_found"] = len(job_links)
+                # Test job listing selector
+                job_links = soup.select(config["listing_selector"])
+                test_result["sample_jobs_found"] = len(job_links)
 
-                    if len(job_links) > 0:
-                        test_result["selectors_valid"] = True
-                        test_result["status"] = "success"
-                    else:
-                        test_result["status"] = "failed"
-                        test_result["error"] = "No job listings found with selector"
+                if len(job_links) > 0:
+                    test_result["selectors_valid"] = True
+                    test_result["status"] = "success"
                 else:
                     test_result["status"] = "failed"
-                    test_result["error"] = f"HTTP {response.status_code}"
+                    test_result["error"] = "No job listings found with selector"
+            else:
+                test_result["status"] = "failed"
+                test_result["error"] = f"HTTP {response.status_code}"
 
         except Exception as e:
             test_result["status"] = "failed"
@@ -361,9 +372,17 @@ class AutomatedWorkflowService:
             config_path = (
                 Path(__file__).resolve().parents[1] / "scrapers" / "config.yaml"
             )
+            # Re-parse only when the file changes; a stat is far cheaper than
+            # loading the YAML on every health check and scraper run.
+            mtime_ns = config_path.stat().st_mtime_ns
+            cached = self._scraper_configs_cache
+            if cached is not None and cached[0] == mtime_ns:
+                return dict(cached[1])
             with config_path.open("r") as f:
                 config = yaml.safe_load(f)
-                return config.get("sites", {})
+                sites = config.get("sites", {})
+            self._scraper_configs_cache = (mtime_ns, sites)
+            return dict(sites)
         except Exception as e:
             logger.error(f"Failed to load scraper config: {str(e)}")
             return {}
@@ -430,6 +449,30 @@ class AutomatedWorkflowService:
 
         return score / max_score
 
+    def _calculate_job_quality_scores_batch(
+        self,
+        title_len: np.ndarray,
+        description_len: np.ndarray,
+        requirements_len: np.ndarray,
+        has_company: np.ndarray,
+        has_location: np.ndarray,
+        has_salary: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized `_calculate_job_quality_score` over column arrays.
+
+        Takes text lengths and presence flags for many jobs at once and
+        applies the same weights without a Python loop per job.
+        """
+        score = np.where(title_len > 5, 2.0, 0.0)
+        score += (
+            (description_len > 100).astype(float)
+            + (description_len > 500)
+            + (description_len > 1000)
+        )
+        score += (requirements_len > 50).astype(float) + (requirements_len > 200)
+        score += has_company.astype(float) + has_location + has_salary
+        return score / 10.0
+
     async def _save_processed_job(self, db: AsyncSession, job_data: Dict):
         """Save processed job to database"""
         # Implementation would save the processed job
@@ -9,7 +9,7 @@ from typing import Dict, List
 from ..db.database import SessionLocal
 from ..db.models import User, NotificationPreference, NotificationLog
 from ..services.data_processing_service import data_processing_service
-from ..webhooks.whatsapp import send_whatsapp_message
+from ..tasks.notification_tasks import queue_whatsapp_message
 
 logger = logging.getLogger(__name__)
 
@@ -205,9 +205,9 @@ Reply STOP to unsubscribe from job alerts."""
 
                 message += "Visit CareerSearch to see all opportunities.\nReply STOP to unsubscribe."
 
-            # Send WhatsApp message
-            await send_whatsapp_message(user.phone_number, message)
-            logger.info(f"Sent WhatsApp notification to {user.phone_number}")
+            # Queue WhatsApp message; a worker makes the Twilio call
+            await queue_whatsapp_message(user.phone_number, message)
+            logger.info(f"Queued WhatsApp notification to {user.phone_number}")
 
         except Exception as e:
             logger.error(f"Error sending WhatsApp notification: {e}")
@@ -280,7 +280,7 @@ Reply STOP to unsubscribe from job alerts."""
             success = False
 
             if prefs.whatsapp_enabled and user.phone_number:
-                await send_whatsapp_message(user.phone_number, message)
+                await queue_whatsapp_message(user.phone_number, message)
                 success = True
 
             if prefs.email_enabled and user.email:
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from ..db.models import JobEntities, JobPost, JobSkill, TitleNorm
 from ..db.upsert import upsert_skill
+from ..normalization.dedupe import content_hash
 from ..normalization.extractors import (
     classify_seniority_detailed,
     extract_education_detailed,
@@ -84,10 +85,14 @@ def process_job_posts(
     limit: int = 500,
     only_unprocessed: bool = True,
     dry_run: bool = False,
+    job_ids: list[int] | None = None,
 ) -> Dict[str, Any]:
     """
     Post-ingestion processing for any `job_post` rows.
 
+    When `job_ids` is given, only those rows are considered (still subject to
+    the other filters); this lets callers fan batches out across workers.
+
     Does not fetch remote content; it only processes what's already in DB.
     This makes it safe and deterministic and gives clear visibility into
     which sources are failing to provide enough text for extraction.
@@ -99,6 +104,8 @@ def process_job_posts(
         q = q.filter(JobPost.source == source)
     if only_unprocessed:
         q = q.filter(JobPost.processed_at.is_(None))
+    if job_ids is not None:
+        q = q.filter(JobPost.id.in_(job_ids))
 
     jobs = q.order_by(JobPost.first_seen.desc()).limit(limit).all()
 
@@ -171,6 +178,7 @@ def process_job_posts(
             jobskills_created += 1
 
         job.description_clean = desc_raw
+        job.content_hash = content_hash(title_raw, desc_raw)
         if edu_d and edu_d.get("value"):
             job.education = str(edu_d["value"])
         if seniority_d and seniority_d.get("value"):
@@ -8,6 +8,7 @@ import os
 import logging
 import asyncio
 import sys
+import time
 from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
@@ -52,10 +53,13 @@ class ScraperService:
         process_jobs: bool = True,
         include_recent_jobs: bool = False,
         recent_jobs_limit: int = 10,
+        timeout: float | None = None,
     ) -> Dict[str, Any]:
         """Run config.yaml spider for a specific site and optionally post-process new rows.
 
         Notes:
+        - `timeout` (seconds) bounds the crawl: the spider starts no new listing
+          page after it, since its worker thread cannot be cancelled.
         - The spider writes directly to Postgres when `USE_POSTGRES=true`.
         - `process_jobs=True` runs the deterministic DB-only post-processor
           (skills/entities/quality/title_norm) on newly inserted rows.
@@ -71,12 +75,14 @@ class ScraperService:
 
             # Run scraper in a separate thread to avoid blocking the event loop.
             loop = asyncio.get_running_loop()
+            deadline = time.monotonic() + timeout if timeout is not None else None
             scrape_result = await loop.run_in_executor(
                 None,
                 lambda: scrape_site(
                     site_name,
                     use_postgres=bool(USE_POSTGRES),
                     max_pages=int(os.getenv("SCRAPER_MAX_PAGES", "5")),
+                    deadline=deadline,
                 ),
             )
 
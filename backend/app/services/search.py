@@ -2,6 +2,7 @@ import logging
 import os
 import re
 from collections import Counter
+from datetime import datetime
 from pathlib import Path
 
 import numpy as np
@@ -362,15 +363,20 @@ def search_jobs(
     high_confidence_only: bool = False,
     limit: int = 20,
     offset: int = 0,
+    min_first_seen: datetime | None = None,
 ):
-    """Public search (O0): jobs + title/company aggregates for filtering."""
+    """Public search (O0): jobs + title/company aggregates for filtering.
+
+    `min_first_seen` restricts results to jobs first seen after that time and
+    disables the broader-match suggestions for empty results.
+    """
 
     has_more = False
 
     # Check if query contains degree information
     degree = extract_degree_from_query(q)
     if degree:
-        jobs = search_by_degree(db, degree, location, seniority) or []
+        jobs = search_by_degree(db, degree, location, seniority, min_first_seen) or []
         clusters = Counter()
         companies = Counter()
         for row in jobs:
@@ -451,6 +457,9 @@ def search_jobs(
         filters.append(JobPost.quality_score.is_not(None))
         filters.append(JobPost.quality_score >= 0.7)
 
+    if min_first_seen is not None:
+        filters.append(JobPost.first_seen > min_first_seen)
+
     normalized_family = None
     normalized_title = None
     like = None
@@ -863,7 +872,7 @@ def search_jobs(
     results = rank_results(results, q, user_context)
 
     # If no results, provide suggestions
-    if not results and q:
+    if not results and q and min_first_seen is None:
         return suggest_alternatives(db, q, location, seniority)
 
     return build_search_response(
@@ -955,6 +964,7 @@ def search_by_degree(
     degree: str,
     location: str | None = None,
     seniority: str | None = None,
+    min_first_seen: datetime | None = None,
 ):
     """Search jobs based on degree/field of study"""
 
@@ -1003,6 +1013,9 @@ def search_by_degree(
             )
         )
 
+    if min_first_seen is not None:
+        conditions.append(JobPost.first_seen > min_first_seen)
+
     stmt = stmt.where(*conditions)
     rows = db.execute(stmt.limit(20)).all()
 
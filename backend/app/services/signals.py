@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+import json
 import os
 
-from sqlalchemy import select, func, desc
+from sqlalchemy import bindparam, select, func, desc, text, update
 from sqlalchemy.orm import Session
 
 from ..db.models import (
@@ -125,70 +126,128 @@ def _extract_org_from_title(title: str | None) -> str | None:
     return None
 
 
+_PG_TENDER_NORMALIZE_SQL = text(
+    "UPDATE tender_notice SET organization = :organization, "
+    "category = :category, location = :location, "
+    "meta_json = jsonb_set(COALESCE(meta_json, '{}'::jsonb), '{normalized}', "
+    "COALESCE(meta_json->'normalized', '{}'::jsonb) || CAST(:norm AS jsonb)) "
+    "WHERE id = :id"
+)
+
+
 def normalize_tender_metadata(db: Session, limit: int = 200) -> dict:
-    notices = (
-        db.execute(
-            select(TenderNotice)
-            .where(
-                (TenderNotice.organization.is_(None))
-                | (TenderNotice.category.is_(None))
-                | (TenderNotice.location.is_(None))
-            )
-            .order_by(desc(TenderNotice.created_at))
-            .limit(limit)
+    rows = db.execute(
+        select(
+            TenderNotice.id,
+            TenderNotice.title,
+            TenderNotice.description_raw,
+            TenderNotice.organization,
+            TenderNotice.category,
+            TenderNotice.location,
+            TenderNotice.meta_json,
         )
-        .scalars()
-        .all()
-    )
+        .where(
+            (TenderNotice.organization.is_(None))
+            | (TenderNotice.category.is_(None))
+            | (TenderNotice.location.is_(None))
+        )
+        .order_by(desc(TenderNotice.created_at))
+        .limit(limit)
+    ).all()
 
-    updated = 0
-    for notice in notices:
+    updates = []
+    for row in rows:
         context = " ".join(
             [
-                notice.title or "",
-                notice.description_raw or "",
+                row.title or "",
+                row.description_raw or "",
             ]
         ).strip()
-        meta = notice.meta_json or {}
+        meta = row.meta_json or {}
 
-        organization = (
-            notice.organization or meta.get("org") or meta.get("organization")
-        )
+        organization = row.organization or meta.get("org") or meta.get("organization")
         organization = _clean_text(organization)
         if not organization:
-            organization = _extract_org_from_title(notice.title)
+            organization = _extract_org_from_title(row.title)
 
         category = _canonical_category(
-            notice.category or meta.get("category"),
+            row.category or meta.get("category"),
             context,
         )
-        location = notice.location or meta.get("location")
+        location = row.location or meta.get("location")
         location = _clean_text(location)
         if not location:
             location = _extract_location(context)
 
-        if organization:
-            notice.organization = organization
-        if category:
-            notice.category = category
-        if location:
-            notice.location = location
+        normalized = {
+            "organization": organization or row.organization,
+            "category": category or row.category,
+            "location": location or row.location,
+        }
+        updates.append({"id": row.id, "meta": meta, **normalized})
 
-        meta.setdefault("normalized", {})
-        meta["normalized"].update(
-            {
-                "organization": notice.organization,
-                "category": notice.category,
-                "location": notice.location,
-            }
+    if not updates:
+        return {"status": "success", "updated": 0}
+
+    if db.bind is not None and db.bind.dialect.name == "postgresql":
+        # Merge the ``normalized`` sub-object server-side so the full JSONB
+        # blob is not re-serialized per row.
+        db.execute(
+            _PG_TENDER_NORMALIZE_SQL,
+            [
+                {
+                    "id": item["id"],
+                    "organization": item["organization"],
+                    "category": item["category"],
+                    "location": item["location"],
+                    "norm": json.dumps(
+                        {
+                            "organization": item["organization"],
+                            "category": item["category"],
+                            "location": item["location"],
+                        }
+                    ),
+                }
+                for item in updates
+            ],
+        )
+    else:
+        params = []
+        for item in updates:
+            meta = dict(item["meta"])
+            normalized = dict(meta.get("normalized") or {})
+            normalized.update(
+                {
+                    "organization": item["organization"],
+                    "category": item["category"],
+                    "location": item["location"],
+                }
+            )
+            meta["normalized"] = normalized
+            params.append(
+                {
+                    "_id": item["id"],
+                    "_organization": item["organization"],
+                    "_category": item["category"],
+                    "_location": item["location"],
+                    "_meta": meta,
+                }
+            )
+        table = TenderNotice.__table__
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam("_id"))
+            .values(
+                organization=bindparam("_organization"),
+                category=bindparam("_category"),
+                location=bindparam("_location"),
+                meta_json=bindparam("_meta"),
+            ),
+            params,
         )
-        notice.meta_json = meta
-        db.add(notice)
-        updated += 1
 
-    if updated:
-        db.commit()
-    return {"status": "success", "updated": updated}
+    db.commit()
+    return {"status": "success", "updated": len(updates)}
 
 
 def _create_evidence(
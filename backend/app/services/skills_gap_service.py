@@ -68,20 +68,18 @@ class SkillsGapService:
             if str(skill).strip()
         }
 
-        if required_skills:
-            matching_skills = [
-                s for s in required_skills if s.lower() in candidate_skills
-            ]
-            missing_skills = [
-                s for s in required_skills if s.lower() not in candidate_skills
-            ]
-            match_percentage = round(
-                (len(matching_skills) / len(required_skills)) * 100
-            )
-        else:
-            matching_skills = []
-            missing_skills = []
-            match_percentage = 0
+        matching_skills: list[str] = []
+        missing_skills: list[str] = []
+        for skill in required_skills:
+            if skill.lower() in candidate_skills:
+                matching_skills.append(skill)
+            else:
+                missing_skills.append(skill)
+        match_percentage = (
+            round((len(matching_skills) / len(required_skills)) * 100)
+            if required_skills
+            else 0
+        )
 
         salary_estimate = salary_service.estimate_salary_range(
             title=target_role,
@@ -1,15 +1,23 @@
-from datetime import datetime, timedelta
-from uuid import uuid4
+import json
+from datetime import datetime, timedelta, timezone
+from secrets import token_hex
+from types import MappingProxyType
 
 from fastapi import HTTPException, status
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
 from ..db.models import User, UserNotification
 
 
+def _utcnow() -> datetime:
+    # Naive UTC to match the DateTime columns; avoids deprecated utcnow().
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class SubscriptionService:
     def __init__(self) -> None:
-        self._plans = {
+        plans = {
             "professional_monthly": {
                 "code": "professional_monthly",
                 "tier": "professional",
@@ -37,10 +45,35 @@ class SubscriptionService:
                 ],
             },
         }
-        self._providers = {"stripe", "mpesa"}
+        # Plans are static for the process lifetime; expose read-only views
+        # so list/lookup calls don't rebuild containers per request.
+        self._plans = MappingProxyType(plans)
+        self._plans_list = tuple(plans.values())
+        self._url_builders = {
+            "stripe": lambda checkout_id, plan_code: (
+                f"https://checkout.stripe.com/pay/{checkout_id}"
+            ),
+            "mpesa": lambda checkout_id, plan_code: (
+                "https://payments.nextstep.co.ke/mpesa"
+                f"?checkout_id={checkout_id}&plan={plan_code}"
+            ),
+        }
+        self._pricing = {
+            code: (plan["amount"], plan["currency"]) for code, plan in plans.items()
+        }
+        self._durations = {
+            code: timedelta(days=plan["duration_days"]) for code, plan in plans.items()
+        }
+        self._plans_json = json.dumps(
+            self._plans_list, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
 
-    def list_plans(self) -> list[dict]:
-        return list(self._plans.values())
+    def list_plans(self) -> tuple[dict, ...]:
+        return self._plans_list
+
+    def list_plans_json(self) -> bytes:
+        """Pre-serialized plan catalog for responses that skip re-encoding."""
+        return self._plans_json
 
     def create_checkout(
         self,
@@ -48,99 +81,155 @@ class SubscriptionService:
         plan_code: str,
         provider: str,
     ) -> dict:
-        plan = self._plans.get(plan_code)
-        if not plan:
+        pricing = self._pricing.get(plan_code)
+        if pricing is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Unsupported subscription plan",
             )
 
-        if provider not in self._providers:
+        build_url = self._url_builders.get(provider)
+        if build_url is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Unsupported payment provider",
             )
 
-        checkout_id = uuid4().hex
-
-        if provider == "stripe":
-            checkout_url = f"https://checkout.stripe.com/pay/{checkout_id}"
-        else:
-            checkout_url = (
-                "https://payments.nextstep.co.ke/mpesa"
-                f"?checkout_id={checkout_id}&plan={plan_code}"
-            )
+        checkout_id = token_hex(16)
+        amount, currency = pricing
 
         return {
             "checkout_id": checkout_id,
             "status": "pending",
             "provider": provider,
             "plan_code": plan_code,
-            "amount": plan["amount"],
-            "currency": plan["currency"],
-            "checkout_url": checkout_url,
+            "amount": amount,
+            "currency": currency,
+            "checkout_url": build_url(checkout_id, plan_code),
             "user_id": user.id,
         }
 
     def activate_plan(self, db: Session, user: User, plan_code: str) -> dict:
         return self.activate_plan_by_user_id(db, user.id, plan_code)
 
+    def _get_plan(self, plan_code: str) -> dict:
+        plan = self._plans.get(plan_code)
+        if not plan:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Unsupported subscription plan",
+            )
+        return plan
+
+    def _apply_plan(
+        self,
+        user_id: int,
+        current_expiry: datetime | None,
+        plan: dict,
+        plan_code: str,
+        now: datetime,
+    ) -> tuple[datetime, dict, dict]:
+        """Return (new expiry, notification row, result) for one activation."""
+        start = current_expiry if current_expiry and current_expiry > now else now
+        new_expiry = start + self._durations[plan_code]
+
+        expiry_date = (
+            f"{new_expiry.year:04d}-{new_expiry.month:02d}-{new_expiry.day:02d}"
+        )
+
+        notification = {
+            "user_id": user_id,
+            "type": "subscription_upgrade",
+            "title": "Subscription upgraded",
+            "message": f"Your {plan['name']} plan is now active until {expiry_date}.",
+            "data": {
+                "plan_code": plan_code,
+                "subscription_tier": plan["tier"],
+                "source": "payment",
+            },
+            "delivered_via": ["in_app"],
+            "delivery_status": {"in_app": "delivered"},
+        }
+        result = {
+            "message": "Subscription activated successfully",
+            "plan_code": plan_code,
+            "subscription_tier": plan["tier"],
+            "subscription_expires": new_expiry.isoformat(timespec="seconds"),
+        }
+        return new_expiry, notification, result
+
     def activate_plan_by_user_id(
         self,
         db: Session,
         user_id: int,
         plan_code: str,
     ) -> dict:
-        plan = self._plans.get(plan_code)
-        if not plan:
+        plan = self._get_plan(plan_code)
+
+        # Only the current expiry is needed; skip hydrating a full User.
+        row = db.execute(
+            select(User.subscription_expires).where(User.id == user_id)
+        ).first()
+        if row is None:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Unsupported subscription plan",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
             )
 
-        managed_user = db.get(User, user_id)
-        if managed_user is None:
+        new_expiry, notification, result = self._apply_plan(
+            user_id, row.subscription_expires, plan, plan_code, _utcnow()
+        )
+        db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(subscription_tier=plan["tier"], subscription_expires=new_expiry)
+        )
+        # Notifications are append-only, so a Core INSERT skips the ORM
+        # unit-of-work bookkeeping for the new row.
+        db.execute(insert(UserNotification.__table__).values(**notification))
+        db.commit()
+        # The result is built from in-memory values, so no refresh SELECT.
+        return result
+
+    def activate_plans_bulk(
+        self,
+        db: Session,
+        items: list[tuple[int, str]],
+    ) -> list[dict]:
+        """Activate many (user_id, plan_code) pairs in one transaction."""
+        if not items:
+            return []
+
+        plans = [self._get_plan(plan_code) for _, plan_code in items]
+        user_ids = {user_id for user_id, _ in items}
+        users = {
+            user.id: user
+            for user in db.execute(select(User).where(User.id.in_(user_ids)))
+            .scalars()
+            .all()
+        }
+        if len(users) != len(user_ids):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
 
-        now = datetime.utcnow()
-        current_expiry = managed_user.subscription_expires or now
-        effective_start = current_expiry if current_expiry > now else now
-        new_expiry = effective_start + timedelta(days=plan["duration_days"])
-
-        managed_user.subscription_tier = plan["tier"]
-        managed_user.subscription_expires = new_expiry
-
-        db.add(
-            UserNotification(
-                user_id=managed_user.id,
-                type="subscription_upgrade",
-                title="Subscription upgraded",
-                message=(
-                    f"Your {plan['name']} plan is now active until "
-                    f"{new_expiry.date().isoformat()}."
-                ),
-                data={
-                    "plan_code": plan_code,
-                    "subscription_tier": managed_user.subscription_tier,
-                    "source": "payment",
-                },
-                delivered_via=["in_app"],
-                delivery_status={"in_app": "delivered"},
+        now = _utcnow()
+        notifications: list[dict] = []
+        results: list[dict] = []
+        for (user_id, plan_code), plan in zip(items, plans):
+            user = users[user_id]
+            new_expiry, notification, result = self._apply_plan(
+                user_id, user.subscription_expires, plan, plan_code, now
             )
-        )
+            user.subscription_tier = plan["tier"]
+            user.subscription_expires = new_expiry
+            notifications.append(notification)
+            results.append({"user_id": user_id, **result})
 
+        db.bulk_insert_mappings(UserNotification, notifications)
         db.commit()
-        db.refresh(managed_user)
-
-        return {
-            "message": "Subscription activated successfully",
-            "plan_code": plan_code,
-            "subscription_tier": managed_user.subscription_tier,
-            "subscription_expires": (managed_user.subscription_expires.isoformat()),
-        }
+        return results
 
 
 subscription_service = SubscriptionService()
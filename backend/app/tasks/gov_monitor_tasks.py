@@ -1,15 +1,68 @@
-import asyncio
 import logging
 
+from celery import group
+from sqlalchemy import func, select
+
 from ..core.celery_app import celery_app
-from ..db.database import get_db
+from ..core.locks import get_redis_client
+from ..db.database import SessionLocal
+from ..db.models import JobPost
 from ..ingestion.runner import run_government_sources
 from ..services.post_ingestion_processing_service import process_job_posts
 
 logger = logging.getLogger(__name__)
 
+GOV_SOURCE = "gov_careers"
+POST_PROCESS_LIMIT = 2000
+POST_PROCESS_BATCH_SIZE = 100
+PROCESS_CURSOR_KEY = "gov_careers:last_processed_id"
+
+
+def _read_process_cursor() -> int:
+    """Job id below which every gov posting is processed (0 if unknown)."""
+    try:
+        value = get_redis_client().get(PROCESS_CURSOR_KEY)
+        return int(value) if value else 0
+    except Exception as exc:  # pragma: no cover - redis optional
+        logger.warning("Redis unavailable; scanning without cursor: %s", exc)
+        return 0
+
+
+def _write_process_cursor(job_id: int) -> None:
+    try:
+        get_redis_client().set(PROCESS_CURSOR_KEY, int(job_id))
+    except Exception as exc:  # pragma: no cover - redis optional
+        logger.warning("Failed to store gov processing cursor: %s", exc)
+
+
+def _advance_process_cursor(db, batch_ids: list[int]) -> None:
+    """Move the cursor up to just below the oldest gov posting still unprocessed.
+
+    Called after a batch commits. The cursor never passes a row that has not
+    been processed, so rows from failed or lost batches are rescanned, and it
+    stops at this batch's highest id rather than the newest row overall.
+    """
+    cursor = _read_process_cursor()
+    oldest_pending = db.execute(
+        select(func.min(JobPost.id))
+        .where(JobPost.source == GOV_SOURCE)
+        .where(JobPost.processed_at.is_(None))
+        .where(JobPost.id > cursor)
+    ).scalar()
+    target = max(batch_ids)
+    if oldest_pending is not None:
+        target = min(target, oldest_pending - 1)
+    if target > cursor:
+        _write_process_cursor(target)
 
-@celery_app.task(bind=True, name="app.tasks.gov_monitor_tasks.run_government_sources")
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.gov_monitor_tasks.run_government_sources",
+    acks_late=True,
+    ignore_result=True,
+    track_started=False,
+)
 def run_government_sources_task(self):
     """
     Monitor government career pages and ingest new postings.
@@ -20,42 +73,80 @@ def run_government_sources_task(self):
             meta={"status": "Starting government source monitoring", "progress": 0},
         )
 
-        result = asyncio.run(_run_government_sources_async())
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Government source monitoring completed",
-                "progress": 100,
-                "result": result,
-            },
-        )
-
-        return result
+        # Celery records SUCCESS/FAILURE itself from the return value or the
+        # raised exception, so only the PROGRESS state is written here.
+        return _run_government_sources_sync()
 
     except Exception as exc:
         logger.error("Government source monitoring failed: %s", exc)
-        self.update_state(
-            state="FAILURE",
-            meta={
-                "status": f"Government source monitoring failed: {exc}",
-                "progress": 0,
-            },
-        )
         raise
 
 
-async def _run_government_sources_async():
-    async for db in get_db():
-        try:
-            ingested = run_government_sources(db)
-            processed = process_job_posts(
-                db,
-                source="gov_careers",
-                limit=2000,
-                only_unprocessed=True,
-                dry_run=False,
+def _run_government_sources_sync():
+    # Nothing here awaits, so use a plain session rather than paying for an
+    # event loop per task run.
+    db = SessionLocal()
+    try:
+        ingested = run_government_sources(db)
+        # Only look past the processed watermark so the unprocessed scan is
+        # an indexed range scan. Batches advance it as they commit, so rows
+        # from a failed batch stay above it and are picked up again here.
+        cursor = _read_process_cursor()
+        job_ids = (
+            db.execute(
+                select(JobPost.id)
+                .where(JobPost.source == GOV_SOURCE)
+                .where(JobPost.processed_at.is_(None))
+                .where(JobPost.id > cursor)
+                .order_by(JobPost.id)
+                .limit(POST_PROCESS_LIMIT)
             )
-            return {"ingested": ingested, "post_process": processed}
-        finally:
-            await db.close()
+            .scalars()
+            .all()
+        )
+    finally:
+        db.close()
+
+    # Fan post-processing out so batches run in parallel across workers
+    # instead of serially inside the beat task.
+    batches = [
+        job_ids[i : i + POST_PROCESS_BATCH_SIZE]
+        for i in range(0, len(job_ids), POST_PROCESS_BATCH_SIZE)
+    ]
+    if batches:
+        group(
+            process_government_posts_batch.s(batch) for batch in batches
+        ).apply_async()
+
+    return {
+        "ingested": ingested,
+        "post_process": {
+            "status": "dispatched",
+            "jobs": len(job_ids),
+            "batches": len(batches),
+        },
+    }
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.gov_monitor_tasks.process_government_posts_batch",
+    acks_late=True,
+    ignore_result=True,
+)
+def process_government_posts_batch(self, job_ids: list[int]):
+    """Post-process one batch of freshly ingested government postings."""
+    db = SessionLocal()
+    try:
+        result = process_job_posts(
+            db,
+            source=GOV_SOURCE,
+            limit=len(job_ids),
+            only_unprocessed=True,
+            dry_run=False,
+            job_ids=job_ids,
+        )
+        _advance_process_cursor(db, job_ids)
+        return result
+    finally:
+        db.close()
@@ -0,0 +1,29 @@
+import asyncio
+import logging
+
+from ..core.celery_app import celery_app
+from ..webhooks.whatsapp import send_whatsapp_message_sync
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="app.tasks.notification_tasks.send_whatsapp_message", ignore_result=True
+)
+def send_whatsapp_message_task(to_number: str, message: str) -> bool:
+    """Deliver one WhatsApp message through Twilio on a worker."""
+    return send_whatsapp_message_sync(to_number, message)
+
+
+async def queue_whatsapp_message(to_number: str, message: str) -> None:
+    """Hand a WhatsApp message to the workers so the caller does not wait on
+    the Twilio round-trip.
+
+    Falls back to sending from a thread when the message cannot be queued, so
+    a broker outage never puts the blocking Twilio call on the event loop.
+    """
+    try:
+        send_whatsapp_message_task.delay(to_number, message)
+    except Exception as exc:
+        logger.warning("Could not queue WhatsApp message, sending directly: %s", exc)
+        await asyncio.to_thread(send_whatsapp_message_sync, to_number, message)
@@ -3,6 +3,8 @@ import logging
 from datetime import datetime
 from typing import Any, Dict
 
+from sqlalchemy.orm import scoped_session
+
 from ..core.celery_app import celery_app
 from ..core.locks import redis_lock
 from ..db.database import SessionLocal
@@ -11,15 +13,28 @@ from ..services.processing_log_service import log_processing_event
 
 logger = logging.getLogger(__name__)
 
+# Thread-local session registry for the beat task. Prefork workers run tasks
+# on a stable thread; remove() closes the session and returns its connection
+# to the shared engine pool.
+ScopedSession = scoped_session(SessionLocal)
+
+# Read once at import; workers are restarted to change deployment flags.
+_PIPELINE_ENABLED = os.getenv("ENABLE_CELERY_PIPELINE", "false").lower() == "true"
+
 
-@celery_app.task(bind=True, name="app.tasks.pipeline_tasks.run_incremental_pipeline")
+@celery_app.task(
+    bind=True,
+    name="app.tasks.pipeline_tasks.run_incremental_pipeline",
+    ignore_result=True,
+    track_started=False,
+)
 def run_incremental_pipeline_task(self) -> Dict[str, Any]:
     """Run the production incremental pipeline on a schedule (Celery beat).
 
     This is guarded by env `ENABLE_CELERY_PIPELINE=true` to prevent accidental
     double-scheduling when systemd timers are used in production.
     """
-    if os.getenv("ENABLE_CELERY_PIPELINE", "false").lower() != "true":
+    if not _PIPELINE_ENABLED:
         return {"status": "skipped", "reason": "ENABLE_CELERY_PIPELINE != true"}
 
     lock_key = "nextstep:pipeline_incremental"
@@ -32,19 +47,13 @@ def run_incremental_pipeline_task(self) -> Dict[str, Any]:
             meta={"status": "Starting incremental pipeline", "progress": 0},
         )
 
-        db = SessionLocal()
+        # Session creation is lazy (no connection checkout until the first
+        # query), so there is no DB latency to overlap with the lock RTT.
+        db = ScopedSession()
         try:
             opts = PipelineOptions(strict=False)
-            result = run_incremental_pipeline(db, opts=opts)
-            self.update_state(
-                state="SUCCESS",
-                meta={
-                    "status": "Pipeline completed",
-                    "progress": 100,
-                    "result": result,
-                },
-            )
-            return result
+            # Celery sets SUCCESS/FAILURE from the return value or exception.
+            return run_incremental_pipeline(db, opts=opts)
         except Exception as exc:
             logger.error("Incremental pipeline failed: %s", exc)
             try:
@@ -57,10 +66,6 @@ def run_incremental_pipeline_task(self) -> Dict[str, Any]:
                 )
             except Exception:
                 pass
-            self.update_state(
-                state="FAILURE",
-                meta={"status": f"Pipeline failed: {exc}", "progress": 0},
-            )
             raise
         finally:
-            db.close()
+            ScopedSession.remove()
@@ -1,24 +1,194 @@
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, List
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List
 from datetime import datetime, timedelta
 
+from celery import group, signals
+from sqlalchemy.sql import Executable
+
 from ..core.celery_app import celery_app
-from ..db.database import get_db, SessionLocal
+from ..db.database import SessionLocal, dispose_engine_after_fork, session_scope
 from ..services.automated_workflow_service import automated_workflow_service
 from ..services.email_service import send_email
+from ..normalization.skills import extract_and_normalize_skills
+from ..normalization.titles import normalize_title
 from ..processors.job_processor import JobProcessor
+from .worker_loop import get_worker_loop, run_in_worker_loop
 
 logger = logging.getLogger(__name__)
 
+# Postings repeat the same titles and boilerplate descriptions constantly, so
+# per-process caches skip most of the normalization work on busy workers.
+TITLE_CACHE_SIZE = 50000
+SKILL_CACHE_SIZE = 5000
+
+# Rows are fetched in chunks of this size rather than materialized up front.
+STREAM_BATCH_SIZE = 100
+
+# Rows between PROGRESS updates; each update is a result-backend round-trip.
+PROGRESS_EVERY = 50
+
+# Rows per committed write when a helper persists a large batch.
+WRITE_CHUNK_SIZE = 100
+
+# Jobs per cleanup run whose missing content_hash is backfilled.
+CONTENT_HASH_BACKFILL_LIMIT = 5000
+
+# Job ids per task when a large id list is fanned out across workers.
+FANOUT_CHUNK_SIZE = 50
+
+# Alert runs are split into this many JobAlert.id % N shards, each its own
+# task; 1 processes every alert inline in the scheduled task.
+ALERT_SHARDS = int(os.getenv("ALERT_SHARDS", "1"))
+
+# Duplicate cleanup is split into this many shards (at most 16, one or more
+# leading content_hash hex digits each); 1 runs it as a single task.
+DEDUPE_SHARDS = min(int(os.getenv("DEDUPE_SHARDS", "1")), 16)
+
+# Upper bound on JobProcessor.process_job calls in flight per batch.
+JOB_PROCESS_CONCURRENCY = int(os.getenv("JOB_PROCESS_CONCURRENCY", "8"))
+
+# Upper bound on normalization calls in flight per batch.
+NLP_CONCURRENCY = 16
+
+# Skill extraction and title normalization are CPU-bound pure Python; a
+# process pool lets them use every core. 0 keeps them on threads, which is
+# required under Celery's prefork pool (daemon processes cannot fork).
+NLP_PROCESS_WORKERS = int(os.getenv("NLP_PROCESS_WORKERS", "0"))
+
+_job_processor: JobProcessor | None = None
+_nlp_pool: ProcessPoolExecutor | None = None
+_nlp_pool_lock = threading.Lock()
+
+_skill_cache: "OrderedDict[bytes, Dict[str, float]]" = OrderedDict()
+_skill_cache_lock = threading.Lock()
+
+# Skill name -> id for the (small, slow-changing) skill catalog. Loaded on
+# first use and extended with ids only after the inserting batch commits.
+_skill_id_cache: Dict[str, int] = {}
+_skill_id_cache_loaded = False
+_skill_id_cache_lock = threading.RLock()
+
+
+def _get_job_processor() -> JobProcessor:
+    """Return the per-process JobProcessor, creating it on first use."""
+    global _job_processor
+    if _job_processor is None:
+        _job_processor = JobProcessor()
+    return _job_processor
+
+
+@signals.worker_process_init.connect
+def _init_worker_process(**kwargs):
+    dispose_engine_after_fork()
+    _get_job_processor()
+    get_worker_loop()
+
 
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def _normalize_title_cached(raw: str) -> tuple[str, str]:
+    return normalize_title(raw)
+
+
+def _extract_skills_cached(text: str) -> Dict[str, float]:
+    """extract_and_normalize_skills with a bounded LRU keyed on a text digest.
+
+    Descriptions are long, so the cache stores a 16-byte blake2b digest
+    rather than the text itself. Callers must not mutate the returned dict.
+    """
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    with _skill_cache_lock:
+        skills = _skill_cache.get(key)
+        if skills is not None:
+            _skill_cache.move_to_end(key)
+            return skills
+
+    skills = extract_and_normalize_skills(text)
+    with _skill_cache_lock:
+        _skill_cache[key] = skills
+        if len(_skill_cache) > SKILL_CACHE_SIZE:
+            _skill_cache.popitem(last=False)
+    return skills
+
+
+def _get_nlp_pool() -> Executor | None:
+    """Return the shared NLP process pool, or None to use threads."""
+    global _nlp_pool
+    if NLP_PROCESS_WORKERS <= 0:
+        return None
+    with _nlp_pool_lock:
+        if _nlp_pool is None:
+            _nlp_pool = ProcessPoolExecutor(max_workers=NLP_PROCESS_WORKERS)
+    return _nlp_pool
+
+
+def _remember_skill_ids(skill_ids: Dict[str, int], loaded: bool = False) -> None:
+    global _skill_id_cache_loaded
+    with _skill_id_cache_lock:
+        _skill_id_cache.update(skill_ids)
+        if loaded:
+            _skill_id_cache_loaded = True
+
+
+async def _gather_bounded(func: Callable[[Any], Any], args: Iterable[Any]) -> list:
+    """Run ``func`` over ``args`` off the event loop, NLP_CONCURRENCY at a time.
+
+    Calls go to the NLP process pool when configured, otherwise to the
+    loop's default thread pool. The session is only touched by the caller.
+    Exceptions are returned in place of results.
+    """
+    loop = asyncio.get_running_loop()
+    executor = _get_nlp_pool()
+    semaphore = asyncio.Semaphore(NLP_CONCURRENCY)
+
+    async def _one(arg):
+        async with semaphore:
+            return await loop.run_in_executor(executor, func, arg)
+
+    return await asyncio.gather(*(_one(arg) for arg in args), return_exceptions=True)
+
+
+def _throttled_progress(task, status: str, every: int = PROGRESS_EVERY):
+    """Return a ``(done, total)`` callback reporting PROGRESS every ``every`` rows.
+
+    Celery records SUCCESS/FAILURE itself from the return value or exception,
+    so tasks only report intermediate progress. The task id is captured here
+    because the request context is thread-local and the callback runs on the
+    worker loop thread.
+    """
+    task_id = task.request.id
+
+    def report(done: int, total: int) -> None:
+        if total and done % every == 0:
+            task.update_state(
+                task_id=task_id,
+                state="PROGRESS",
+                meta={"status": status, "progress": int(100 * done / total)},
+            )
+
+    return report
+
+
+# The processing tasks only touch rows that still need work, so a batch
+# redelivered after a worker crash is safe to rerun. They acknowledge late so
+# such a crash does not drop the batch. Alerts send email and ack early.
 @celery_app.task(
     bind=True,
+    acks_late=True,
     name="app.tasks.processing_tasks.process_raw_jobs",
 )
-def process_raw_jobs(self, batch_size: int = 100):
+def process_raw_jobs(self, batch_size: int = 100, chain_stages: bool = False):
     """
     Process raw job data in batches
+
+    With ``chain_stages``, the downstream stages are dispatched for exactly
+    the jobs this batch processed rather than waiting for their own scans.
     """
     try:
         self.update_state(
@@ -29,72 +199,59 @@ def process_raw_jobs(self, batch_size: int = 100):
             },
         )
 
-        result = asyncio.run(_process_raw_jobs_async(batch_size))
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Job processing completed successfully",
-                "progress": 100,
-                "result": result,
-            },
+        result = run_in_worker_loop(
+            _process_raw_jobs_async(
+                batch_size, _throttled_progress(self, "Processing jobs")
+            )
         )
-
+        processed_ids = result.pop("processed_ids")
+        if chain_stages:
+            dispatch_job_stages(processed_ids)
         return result
 
     except Exception as e:
         logger.error(f"Job processing failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={
-                "status": f"Job processing failed: {str(e)}",
-                "progress": 0,
-            },
-        )
         raise
 
 
 @celery_app.task(
     bind=True,
+    acks_late=True,
     name="app.tasks.processing_tasks.clean_duplicate_jobs",
 )
-def clean_duplicate_jobs(self):
+def clean_duplicate_jobs(
+    self, shard_index: int | None = None, num_shards: int | None = None
+):
     """
     Clean duplicate job postings from the database
+
+    With ``num_shards``, only this shard's slice is handled. When omitted and
+    DEDUPE_SHARDS > 1, one task per shard is dispatched instead.
     """
     try:
+        if num_shards is None and DEDUPE_SHARDS > 1:
+            group(
+                clean_duplicate_jobs.s(i, DEDUPE_SHARDS) for i in range(DEDUPE_SHARDS)
+            ).apply_async()
+            return {"status": "dispatched", "shards": DEDUPE_SHARDS}
+
         self.update_state(
             state="PROGRESS",
             meta={"status": "Starting duplicate cleanup", "progress": 0},
         )
 
-        result = asyncio.run(_clean_duplicate_jobs_async())
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Duplicate cleanup completed successfully",
-                "progress": 100,
-                "result": result,
-            },
+        return run_in_worker_loop(
+            _clean_duplicate_jobs_async(shard_index or 0, num_shards or 1)
         )
 
-        return result
-
     except Exception as e:
         logger.error(f"Duplicate cleanup failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={
-                "status": f"Duplicate cleanup failed: {str(e)}",
-                "progress": 0,
-            },
-        )
         raise
 
 
 @celery_app.task(
     bind=True,
+    acks_late=True,
     name="app.tasks.processing_tasks.extract_job_skills",
 )
 def extract_job_skills(self, job_ids: List[int] = None):
@@ -107,33 +264,16 @@ def extract_job_skills(self, job_ids: List[int] = None):
             meta={"status": "Starting skill extraction", "progress": 0},
         )
 
-        result = asyncio.run(_extract_job_skills_async(job_ids))
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Skill extraction completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
-
-        return result
+        return run_in_worker_loop(_extract_job_skills_async(job_ids))
 
     except Exception as e:
         logger.error(f"Skill extraction failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={
-                "status": f"Skill extraction failed: {str(e)}",
-                "progress": 0,
-            },
-        )
         raise
 
 
 @celery_app.task(
     bind=True,
+    acks_late=True,
     name="app.tasks.processing_tasks.normalize_job_titles",
 )
 def normalize_job_titles(self, job_ids: List[int] = None):
@@ -146,33 +286,17 @@ def normalize_job_titles(self, job_ids: List[int] = None):
             meta={"status": "Starting title normalization", "progress": 0},
         )
 
-        result = asyncio.run(_normalize_job_titles_async(job_ids))
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Title normalization completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
-
-        return result
+        return run_in_worker_loop(_normalize_job_titles_async(job_ids))
 
     except Exception as e:
         logger.error(f"Title normalization failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={
-                "status": f"Title normalization failed: {str(e)}",
-                "progress": 0,
-            },
-        )
         raise
 
 
 @celery_app.task(
-    bind=True, name="app.tasks.processing_tasks.calculate_job_quality_scores"
+    bind=True,
+    acks_late=True,
+    name="app.tasks.processing_tasks.calculate_job_quality_scores",
 )
 def calculate_job_quality_scores(self, job_ids: List[int] = None):
     """
@@ -187,33 +311,16 @@ def calculate_job_quality_scores(self, job_ids: List[int] = None):
             },
         )
 
-        result = asyncio.run(_calculate_job_quality_scores_async(job_ids))
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Quality score calculation completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
-
-        return result
+        return run_in_worker_loop(_calculate_job_quality_scores_async(job_ids))
 
     except Exception as e:
         logger.error(f"Quality score calculation failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={
-                "status": f"Quality score calculation failed: {str(e)}",
-                "progress": 0,
-            },
-        )
         raise
 
 
 @celery_app.task(
     bind=True,
+    acks_late=True,
     name="app.tasks.processing_tasks.update_job_embeddings",
 )
 def update_job_embeddings(self, job_ids: List[int] = None):
@@ -226,33 +333,16 @@ def update_job_embeddings(self, job_ids: List[int] = None):
             meta={"status": "Starting embedding updates", "progress": 0},
         )
 
-        result = asyncio.run(_update_job_embeddings_async(job_ids))
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Embedding updates completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
-
-        return result
+        return run_in_worker_loop(_update_job_embeddings_async(job_ids))
 
     except Exception as e:
         logger.error(f"Embedding updates failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={
-                "status": f"Embedding updates failed: {str(e)}",
-                "progress": 0,
-            },
-        )
         raise
 
 
 @celery_app.task(
     bind=True,
+    acks_late=True,
     name="app.tasks.processing_tasks.validate_job_data",
 )
 def validate_job_data(self, job_ids: List[int] = None):
@@ -265,71 +355,172 @@ def validate_job_data(self, job_ids: List[int] = None):
             meta={"status": "Starting job data validation", "progress": 0},
         )
 
-        result = asyncio.run(_validate_job_data_async(job_ids))
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Job data validation completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
-
-        return result
+        return _validate_job_data_sync(job_ids)
 
     except Exception as e:
         logger.error(f"Job data validation failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={
-                "status": f"Job data validation failed: {str(e)}",
-                "progress": 0,
-            },
-        )
         raise
 
 
+def dispatch_job_chunks(task, job_ids: List[int], chunk_size: int = FANOUT_CHUNK_SIZE):
+    """Fan ``task`` out over ``job_ids`` as a group of fixed-size chunks.
+
+    Use with the job_ids-based tasks above (skills, titles, quality scores,
+    embeddings) so a long id list is spread across workers instead of
+    occupying one slot.
+    """
+    if not job_ids:
+        return None
+    return group(
+        task.s(job_ids[i : i + chunk_size]) for i in range(0, len(job_ids), chunk_size)
+    ).apply_async()
+
+
+def dispatch_job_stages(job_ids: List[int]):
+    """Run the per-job processing stages for ``job_ids`` in parallel.
+
+    The stages are independent of one another, so they are dispatched as a
+    group rather than a chain or chord, which would also require a result
+    backend.
+    """
+    if not job_ids:
+        return None
+    return group(
+        extract_job_skills.si(job_ids),
+        normalize_job_titles.si(job_ids),
+        calculate_job_quality_scores.si(job_ids),
+        update_job_embeddings.si(job_ids),
+    ).apply_async()
+
+
 # Async helper functions
-async def _process_raw_jobs_async(batch_size: int) -> Dict[str, Any]:
+async def _write_in_chunks(db, stmt, rows: List[Any], label: str) -> int:
+    """Execute ``stmt`` over ``rows`` in WRITE_CHUNK_SIZE slices, committing each.
+
+    ``stmt`` is either a statement run with each slice as executemany
+    parameters, or a callable that builds a complete statement from a slice.
+    A failing slice is rolled back and logged without losing the slices
+    already committed. Returns the number of rows written.
+    """
+    written = 0
+    for start in range(0, len(rows), WRITE_CHUNK_SIZE):
+        chunk = rows[start : start + WRITE_CHUNK_SIZE]
+        try:
+            if isinstance(stmt, Executable):
+                await db.execute(stmt, chunk)
+            else:
+                await db.execute(stmt(chunk))
+            await db.commit()
+            written += len(chunk)
+        except Exception as e:
+            await db.rollback()
+            logger.error(
+                "Failed to write %s rows %d-%d: %s",
+                label,
+                start,
+                start + len(chunk) - 1,
+                str(e),
+            )
+    return written
+
+
+async def _update_job_column(
+    db, column_name: str, pairs: List[tuple], label: str
+) -> int:
+    """Set ``job_post.<column_name>`` from ``(id, value)`` pairs in chunks.
+
+    On Postgres each chunk is a single ``UPDATE ... FROM (VALUES ...)``
+    statement; other dialects fall back to an executemany UPDATE.
+    """
+    from sqlalchemy import Integer, bindparam, cast, column, update, values
+    from ..db.models import JobPost
+
+    job_table = JobPost.__table__
+    if db.bind.dialect.name != "postgresql":
+        return await _write_in_chunks(
+            db,
+            update(job_table)
+            .where(job_table.c.id == bindparam("_id"))
+            .values({column_name: bindparam("_value")}),
+            [{"_id": job_id, "_value": value} for job_id, value in pairs],
+            label,
+        )
+
+    value_type = job_table.c[column_name].type
+
+    def _build(chunk):
+        v = values(column("id", Integer), column("value", value_type), name="v").data(
+            chunk
+        )
+        # VALUES columns are untyped on the server (an all-NULL chunk reads
+        # as text), so cast back to the target column's type.
+        return (
+            update(job_table)
+            .where(job_table.c.id == v.c.id)
+            .values({column_name: cast(v.c.value, value_type)})
+        )
+
+    return await _write_in_chunks(db, _build, pairs, label)
+
+
+async def _process_raw_jobs_async(
+    batch_size: int,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> Dict[str, Any]:
     """Process raw jobs asynchronously"""
-    async for db in get_db():
+    async with session_scope() as db:
         try:
-            from sqlalchemy import select
+            from sqlalchemy import select, update
             from ..db.models import JobPost
 
             # Get unprocessed jobs
             result = await db.execute(
-                select(JobPost).where(JobPost.processed_at.is_(None)).limit(batch_size)
+                select(
+                    JobPost.id,
+                    JobPost.title_raw.label("title"),
+                    JobPost.description_raw.label("description"),
+                    JobPost.requirements_raw.label("requirements"),
+                    JobPost.url,
+                    JobPost.source,
+                )
+                .where(JobPost.processed_at.is_(None))
+                .limit(batch_size)
+                .execution_options(yield_per=STREAM_BATCH_SIZE)
             )
-            unprocessed_jobs = result.scalars().all()
-
-            job_processor = JobProcessor()
-            processed_count = 0
-            failed_count = 0
-
-            for job in unprocessed_jobs:
-                try:
-                    # Process job data
-                    job_data = {
-                        "id": job.id,
-                        "title": job.title_raw,
-                        "description": job.description_raw,
-                        "requirements": job.requirements_raw,
-                        "url": job.url,
-                        "source": job.source,
-                    }
-
-                    await job_processor.process_job(job_data)
-
-                    # Update job with processed data
-                    job.processed_at = datetime.utcnow()
-                    processed_count += 1
-
-                except Exception as e:
-                    logger.error(f"Failed to process job {job.id}: {str(e)}")
-                    failed_count += 1
-                    continue
+
+            job_processor = _get_job_processor()
+            jobs = [dict(row._mapping) for row in result]
+            total_jobs = len(jobs)
+            semaphore = asyncio.Semaphore(JOB_PROCESS_CONCURRENCY)
+            done = 0
+
+            async def _process_one(job: Dict[str, Any]) -> bool:
+                nonlocal done
+                async with semaphore:
+                    try:
+                        await job_processor.process_job(job)
+                        return True
+                    except Exception as e:
+                        logger.error(f"Failed to process job {job['id']}: {str(e)}")
+                        return False
+                    finally:
+                        done += 1
+                        if on_progress:
+                            on_progress(done, total_jobs)
+
+            # process_job is I/O-bound, so overlap calls up to the limit.
+            outcomes = await asyncio.gather(*(_process_one(job) for job in jobs))
+            processed_ids = [job["id"] for job, ok in zip(jobs, outcomes) if ok]
+            failed_count = total_jobs - len(processed_ids)
+
+            if processed_ids:
+                # Update jobs with processed data
+                await db.execute(
+                    update(JobPost)
+                    .where(JobPost.id.in_(processed_ids))
+                    .values(processed_at=datetime.utcnow())
+                )
+            processed_count = len(processed_ids)
 
             await db.commit()
 
@@ -337,262 +528,416 @@ async def _process_raw_jobs_async(batch_size: int) -> Dict[str, Any]:
                 "status": "completed",
                 "processed_jobs": processed_count,
                 "failed_jobs": failed_count,
-                "total_jobs": len(unprocessed_jobs),
+                "total_jobs": total_jobs,
+                "processed_ids": processed_ids,
             }
 
         except Exception as e:
             await db.rollback()
             logger.error(f"Job processing failed: {str(e)}")
             raise
-        finally:
-            await db.close()
 
 
-async def _clean_duplicate_jobs_async() -> Dict[str, Any]:
-    """Clean duplicate jobs asynchronously"""
-    async for db in get_db():
-        try:
-            from sqlalchemy import select, func, delete
-            from ..db.models import JobPost
+def _content_hash_shard_digits(shard_index: int, num_shards: int) -> List[str]:
+    """Leading content_hash hex digits owned by ``shard_index``."""
+    return [
+        d for i, d in enumerate("0123456789abcdef") if i % num_shards == shard_index
+    ]
 
-            # Find duplicates based on URL and title
-            duplicate_query = (
-                select(
-                    JobPost.url,
-                    JobPost.title_raw,
-                    func.count(JobPost.id).label("count"),
-                    func.min(JobPost.id).label("keep_id"),
-                )
-                .group_by(JobPost.url, JobPost.title_raw)
-                .having(func.count(JobPost.id) > 1)
-            )
 
-            duplicates = await db.execute(duplicate_query)
-            duplicate_groups = duplicates.fetchall()
+async def _clean_duplicate_jobs_async(
+    shard_index: int = 0, num_shards: int = 1
+) -> Dict[str, Any]:
+    """Clean duplicate jobs asynchronously
 
-            deleted_count = 0
+    The url pass shards on a hash of the url and the content pass on the
+    first hex digit of content_hash, so every duplicate group lands in
+    exactly one shard.
+    """
+    async with session_scope() as db:
+        try:
+            from sqlalchemy import bindparam, select, text
+            from ..db.models import JobPost
+            from ..normalization.dedupe import content_hash
+
+            # Backfill content hashes for rows that predate the column or
+            # were never processed, so the content pass below sees them.
+            query = (
+                select(JobPost.id, JobPost.title_raw, JobPost.description_raw)
+                .where(JobPost.content_hash.is_(None))
+                .limit(CONTENT_HASH_BACKFILL_LIMIT)
+            )
+            if num_shards > 1:
+                query = query.where(JobPost.id % num_shards == shard_index)
+            result = await db.execute(
+                query.execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            hashes = [
+                (job_id, digest)
+                for job_id, title_raw, description in result
+                if (digest := content_hash(title_raw, description))
+            ]
+            hashes_backfilled = await _update_job_column(
+                db, "content_hash", hashes, "content hash"
+            )
 
-            for group in duplicate_groups:
-                # Delete all but the first occurrence
-                delete_stmt = delete(JobPost).where(
-                    JobPost.url == group.url,
-                    JobPost.title_raw == group.title_raw,
-                    JobPost.id != group.keep_id,
+            # Keep the lowest id per (url, title_raw) and deactivate the rest
+            # in a single set-based statement. Like the content pass below,
+            # the rows may be referenced by skills, embeddings and dedupe
+            # mappings, so they are never deleted. Shards split on a hash of
+            # the url, so each group is ranked by exactly one shard.
+            url_shard_clause = ""
+            url_params: Dict[str, Any] = {}
+            if num_shards > 1:
+                if db.bind.dialect.name == "postgresql":
+                    url_key = "abs(hashtext(url)::bigint)"
+                else:
+                    url_key = "length(url)"
+                url_shard_clause = f"AND {url_key} % :num_shards = :shard_index"
+                url_params = {"num_shards": num_shards, "shard_index": shard_index}
+            result = await db.execute(
+                text(
+                    f"""
+                    UPDATE job_post SET is_active = FALSE
+                    WHERE id IN (
+                        SELECT id FROM (
+                            SELECT
+                                id,
+                                ROW_NUMBER() OVER (
+                                    PARTITION BY url, title_raw ORDER BY id
+                                ) AS rn
+                            FROM job_post
+                            WHERE is_active = TRUE
+                            {url_shard_clause}
+                        ) ranked
+                        WHERE rn > 1
+                    )
+                    """
+                ),
+                url_params,
+            )
+            url_deactivated_count = result.rowcount or 0
+
+            # Same title + description under a different URL (reposts, source
+            # variants).
+            shard_clause = ""
+            params: Dict[str, Any] = {}
+            if num_shards > 1:
+                shard_clause = "AND substr(content_hash, 1, 1) IN :shard_digits"
+                params["shard_digits"] = _content_hash_shard_digits(
+                    shard_index, num_shards
                 )
-
-                result = await db.execute(delete_stmt)
-                deleted_count += result.rowcount
+            stmt = text(
+                f"""
+                UPDATE job_post SET is_active = FALSE
+                WHERE id IN (
+                    SELECT id FROM (
+                        SELECT
+                            id,
+                            ROW_NUMBER() OVER (
+                                PARTITION BY content_hash ORDER BY id
+                            ) AS rn
+                        FROM job_post
+                        WHERE content_hash IS NOT NULL AND is_active = TRUE
+                        {shard_clause}
+                    ) ranked
+                    WHERE rn > 1
+                )
+                """
+            )
+            if params:
+                stmt = stmt.bindparams(bindparam("shard_digits", expanding=True))
+            result = await db.execute(stmt, params)
+            deactivated_count = result.rowcount or 0
 
             await db.commit()
 
             return {
                 "status": "completed",
-                "duplicate_groups_found": len(duplicate_groups),
-                "jobs_deleted": deleted_count,
+                "url_duplicates_deactivated": url_deactivated_count,
+                "content_hashes_backfilled": hashes_backfilled,
+                "content_duplicates_deactivated": deactivated_count,
             }
 
         except Exception as e:
             await db.rollback()
             logger.error(f"Duplicate cleanup failed: {str(e)}")
             raise
-        finally:
-            await db.close()
 
 
 async def _extract_job_skills_async(
     job_ids: List[int] = None,
 ) -> Dict[str, Any]:
     """Extract job skills asynchronously"""
-    async for db in get_db():
+    async with session_scope() as db:
         try:
-            from sqlalchemy import select
+            from sqlalchemy import insert, select
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
             from ..db.models import JobPost, Skill, JobSkill
-            from ..normalization.skills import extract_and_normalize_skills
 
-            # Get jobs to process
-            query = select(JobPost)
+            # Only jobs without skills: job_skill has no unique constraint, so
+            # this filter is what keeps a redelivered task from adding rows twice.
+            query = select(
+                JobPost.id, JobPost.description_raw, JobPost.requirements_raw
+            ).where(~JobPost.skills.any())
             if job_ids:
                 query = query.where(JobPost.id.in_(job_ids))
-            else:
-                # Process jobs without skills
-                query = query.where(~JobPost.skills.any())
-
-            result = await db.execute(query.limit(500))
-            jobs = result.scalars().all()
-
-            skills_extracted = 0
-            jobs_processed = 0
-
-            for job in jobs:
-                try:
-                    # Extract skills from job description and requirements
-                    text = f"{job.description_raw or ''} {job.requirements_raw or ''}"
-                    skills = extract_and_normalize_skills(text)
-
-                    for skill_name, confidence in skills.items():
-                        if confidence > 0.7:  # Only high-confidence skills
-                            # Get or create skill
-                            skill_result = await db.execute(
-                                select(Skill).where(Skill.name == skill_name)
-                            )
-                            skill = skill_result.scalar_one_or_none()
-
-                            if not skill:
-                                skill = Skill(name=skill_name)
-                                db.add(skill)
-                                await db.flush()
-
-                            # Create job-skill relationship
-                            job_skill = JobSkill(
-                                job_id=job.id,
-                                skill_id=skill.id,
-                                confidence=confidence,
-                            )
-                            db.add(job_skill)
-                            skills_extracted += 1
 
-                    jobs_processed += 1
+            result = await db.execute(
+                query.limit(500).execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
 
-                except Exception as e:
-                    logger.error(f"Failed to extract skills for job {job.id}: {str(e)}")
+            # Run extraction for the whole batch first so skill lookups and
+            # inserts can be issued once per batch rather than once per skill.
+            batch_ids: list[int] = []
+            texts: list[str] = []
+            for job_id, description, requirements in result:
+                # Extract skills from job description and requirements
+                batch_ids.append(job_id)
+                texts.append(f"{description or ''} {requirements or ''}")
+
+            extracted: list[tuple[int, dict[str, float]]] = []
+            outcomes = await _gather_bounded(_extract_skills_cached, texts)
+            for job_id, skills in zip(batch_ids, outcomes):
+                if isinstance(skills, Exception):
+                    logger.error(f"Failed to extract skills for job {job_id}: {skills}")
                     continue
+                # Only high-confidence skills
+                extracted.append((job_id, {n: c for n, c in skills.items() if c > 0.7}))
+            jobs_processed = len(extracted)
+
+            names = {name for _, skills in extracted for name in skills}
+            if names and not _skill_id_cache_loaded:
+                rows = await db.execute(select(Skill.id, Skill.name))
+                _remember_skill_ids({name: sid for sid, name in rows}, loaded=True)
+
+            with _skill_id_cache_lock:
+                skill_ids = {
+                    n: _skill_id_cache[n] for n in names if n in _skill_id_cache
+                }
+
+            uncached = names - skill_ids.keys()
+            if uncached:
+                # Skills created by other workers since the catalog was loaded
+                rows = await db.execute(
+                    select(Skill.id, Skill.name).where(Skill.name.in_(uncached))
+                )
+                skill_ids.update((name, sid) for sid, name in rows.all())
+
+                missing = [{"name": n, "aliases": {}} for n in names - skill_ids.keys()]
+                if missing:
+                    if db.bind.dialect.name == "postgresql":
+                        stmt = (
+                            pg_insert(Skill)
+                            .on_conflict_do_nothing(index_elements=["name"])
+                            .returning(Skill.id, Skill.name)
+                        )
+                    else:
+                        stmt = insert(Skill).returning(Skill.id, Skill.name)
+                    rows = await db.execute(stmt, missing)
+                    skill_ids.update((name, sid) for sid, name in rows.all())
+
+                    # Names inserted concurrently by another worker are skipped
+                    # by ON CONFLICT and not returned; pick them up here.
+                    unresolved = names - skill_ids.keys()
+                    if unresolved:
+                        rows = await db.execute(
+                            select(Skill.id, Skill.name).where(
+                                Skill.name.in_(unresolved)
+                            )
+                        )
+                        skill_ids.update((name, sid) for sid, name in rows.all())
+
+            job_skill_rows = [
+                {
+                    "job_post_id": job_id,
+                    "skill_id": skill_ids[name],
+                    "confidence": confidence,
+                }
+                for job_id, skills in extracted
+                for name, confidence in skills.items()
+                if name in skill_ids
+            ]
+            if job_skill_rows:
+                await db.execute(insert(JobSkill), job_skill_rows)
 
             await db.commit()
+            _remember_skill_ids(skill_ids)
 
             return {
                 "status": "completed",
                 "jobs_processed": jobs_processed,
-                "skills_extracted": skills_extracted,
+                "skills_extracted": len(job_skill_rows),
             }
 
         except Exception as e:
             await db.rollback()
             logger.error(f"Skill extraction failed: {str(e)}")
             raise
-        finally:
-            await db.close()
 
 
 async def _normalize_job_titles_async(
     job_ids: List[int] = None,
 ) -> Dict[str, Any]:
     """Normalize job titles asynchronously"""
-    async for db in get_db():
+    async with session_scope() as db:
         try:
-            from sqlalchemy import select
+            from sqlalchemy import insert, select
             from ..db.models import JobPost, TitleNorm
-            from ..normalization.titles import normalize_title
 
             # Get jobs to process
-            query = select(JobPost).where(JobPost.title_norm_id.is_(None))
+            query = select(JobPost.id, JobPost.title_raw).where(
+                JobPost.title_norm_id.is_(None)
+            )
             if job_ids:
                 query = query.where(JobPost.id.in_(job_ids))
 
-            result = await db.execute(query.limit(1000))
-            jobs = result.scalars().all()
-
-            normalized_count = 0
-
-            for job in jobs:
-                try:
-                    if not job.title_raw:
-                        continue
-
-                    # Normalize the title
-                    family, canonical = normalize_title(job.title_raw)
-
-                    # Get or create title normalization
-                    title_norm_result = await db.execute(
-                        select(TitleNorm).where(
-                            TitleNorm.canonical == canonical,
-                            TitleNorm.family == family,
-                        )
-                    )
-                    title_norm = title_norm_result.scalar_one_or_none()
-
-                    if not title_norm:
-                        title_norm = TitleNorm(
-                            canonical=canonical,
-                            family=family,
-                        )
-                        db.add(title_norm)
-                        await db.flush()
-
-                    # Update job with normalized title
-                    job.title_norm_id = title_norm.id
-                    normalized_count += 1
+            result = await db.execute(
+                query.limit(1000).execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
 
-                except Exception as e:
+            # Normalize every title up front and group jobs by their
+            # (family, canonical_title) pair so each pair is resolved once.
+            # normalize_title lowercases and strips its input, so keying on
+            # that form lets case/whitespace variants share one call.
+            titles: dict[str, list[int]] = {}
+            for job_id, title_raw in result:
+                key = (title_raw or "").strip().lower()
+                if key:
+                    titles.setdefault(key, []).append(job_id)
+
+            norm_map: dict[tuple[str, str], list[int]] = {}
+            outcomes = await _gather_bounded(_normalize_title_cached, titles)
+            for ids, normalized in zip(titles.values(), outcomes):
+                if isinstance(normalized, Exception):
                     logger.error(
-                        f"Failed to normalize title for job {job.id}: {str(e)}"
+                        f"Failed to normalize title for jobs {ids}: {normalized}"
                     )
                     continue
 
+                family, canonical = normalized
+                if not family or not canonical:
+                    continue
+                # TitleNorm columns are String(120)
+                key = (str(family)[:120], str(canonical)[:120])
+                norm_map.setdefault(key, []).extend(ids)
+
+            title_norm_ids: dict[tuple[str, str], int] = {}
+            if norm_map:
+                # title_norm has no unique constraint on the pair, so look up
+                # existing rows first and insert only the missing ones.
+                rows = await db.execute(
+                    select(
+                        TitleNorm.id, TitleNorm.family, TitleNorm.canonical_title
+                    ).where(TitleNorm.canonical_title.in_({c for _, c in norm_map}))
+                )
+                for tn_id, family, canonical in rows.all():
+                    if (family, canonical) in norm_map:
+                        title_norm_ids.setdefault((family, canonical), tn_id)
+
+                missing = [
+                    {"family": family, "canonical_title": canonical, "aliases": {}}
+                    for family, canonical in norm_map
+                    if (family, canonical) not in title_norm_ids
+                ]
+                if missing:
+                    rows = await db.execute(
+                        insert(TitleNorm).returning(
+                            TitleNorm.id, TitleNorm.family, TitleNorm.canonical_title
+                        ),
+                        missing,
+                    )
+                    for tn_id, family, canonical in rows.all():
+                        title_norm_ids[(family, canonical)] = tn_id
+
+            # New TitleNorm rows must be committed before the chunked job
+            # updates that reference them.
             await db.commit()
 
-            return {"status": "completed", "jobs_normalized": normalized_count}
+            updates = [
+                (job_id, title_norm_ids[key])
+                for key, ids in norm_map.items()
+                if key in title_norm_ids
+                for job_id in ids
+            ]
+            normalized = await _update_job_column(
+                db, "title_norm_id", updates, "title norm"
+            )
+
+            return {"status": "completed", "jobs_normalized": normalized}
 
         except Exception as e:
             await db.rollback()
             logger.error(f"Title normalization failed: {str(e)}")
             raise
-        finally:
-            await db.close()
 
 
 async def _calculate_job_quality_scores_async(
     job_ids: List[int] = None,
 ) -> Dict[str, Any]:
     """Calculate job quality scores asynchronously"""
-    async for db in get_db():
+    async with session_scope() as db:
         try:
-            from sqlalchemy import select
-            from ..db.models import JobPost
+            import numpy as np
+            from sqlalchemy import func, select
+            from ..db.models import JobPost, Organization
 
-            # Get jobs to process
-            query = select(JobPost).where(JobPost.quality_score.is_(None))
+            def _length(column):
+                return func.coalesce(func.length(column), 0)
+
+            # Only the lengths and presence flags the score depends on are
+            # fetched; the text itself never leaves the database.
+            query = (
+                select(
+                    JobPost.id,
+                    _length(JobPost.title_raw),
+                    _length(JobPost.description_raw),
+                    _length(JobPost.requirements_raw),
+                    _length(Organization.name) > 0,
+                    JobPost.location_id.is_not(None),
+                    JobPost.salary_min,
+                    JobPost.salary_max,
+                )
+                .outerjoin(Organization, Organization.id == JobPost.org_id)
+                .where(JobPost.quality_score.is_(None))
+            )
             if job_ids:
                 query = query.where(JobPost.id.in_(job_ids))
 
-            result = await db.execute(query.limit(1000))
-            jobs = result.scalars().all()
+            rows = (await db.execute(query.limit(1000))).all()
 
             scored_count = 0
+            if rows:
+                (
+                    ids,
+                    title_len,
+                    description_len,
+                    requirements_len,
+                    has_company,
+                    has_location,
+                    salary_min,
+                    salary_max,
+                ) = zip(*rows)
+                # None salaries become NaN, then 0, matching the truthiness
+                # check in the per-job scorer.
+                salary_min = np.nan_to_num(np.array(salary_min, dtype=float))
+                salary_max = np.nan_to_num(np.array(salary_max, dtype=float))
+
+                scores = automated_workflow_service._calculate_job_quality_scores_batch(
+                    np.array(title_len),
+                    np.array(description_len),
+                    np.array(requirements_len),
+                    np.array(has_company, dtype=bool),
+                    np.array(has_location, dtype=bool),
+                    (salary_min != 0) | (salary_max != 0),
+                )
 
-            for job in jobs:
-                try:
-                    # Calculate quality score
-                    job_data = {
-                        "title": job.title_raw,
-                        "description": job.description_raw,
-                        "requirements": job.requirements_raw,
-                        "company": getattr(job.organization, "name", None)
-                        if job.organization
-                        else None,
-                        "location": getattr(job.location, "name", None)
-                        if job.location
-                        else None,
-                        "salary_min": job.salary_min,
-                        "salary_max": job.salary_max,
-                    }
-
-                    quality_score = (
-                        await automated_workflow_service._calculate_job_quality_score(
-                            job_data
-                        )
-                    )
-                    job.quality_score = quality_score
-                    scored_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        "Failed to calculate quality score for job %s: %s",
-                        job.id,
-                        str(e),
-                    )
-                    continue
-
-            await db.commit()
+                scored_count = await _update_job_column(
+                    db,
+                    "quality_score",
+                    [(job_id, float(score)) for job_id, score in zip(ids, scores)],
+                    "quality score",
+                )
 
             return {"status": "completed", "jobs_scored": scored_count}
 
@@ -600,48 +945,69 @@ async def _calculate_job_quality_scores_async(
             await db.rollback()
             logger.error(f"Quality score calculation failed: {str(e)}")
             raise
-        finally:
-            await db.close()
 
 
 async def _update_job_embeddings_async(
     job_ids: List[int] = None,
 ) -> Dict[str, Any]:
     """Update job embeddings asynchronously"""
-    async for db in get_db():
+    async with session_scope() as db:
         try:
-            from sqlalchemy import select
-            from ..db.models import JobPost
-            from ..ml.embeddings import generate_embeddings
+            from sqlalchemy import insert, select
+            from ..db.models import JobEmbedding, JobPost
+            from ..core.config import settings
+            from ..ml.embeddings import (
+                compact_embeddings,
+                generate_embeddings,
+                generate_embeddings_remote,
+            )
+            from ..ml.model_registry import CANONICAL_EMBEDDING_MODEL_SHORT
 
-            # Get jobs to process
-            query = select(JobPost).where(JobPost.embedding.is_(None))
+            # Get jobs without an embedding for the canonical model
+            embedded_sq = (
+                select(JobEmbedding.job_id)
+                .where(JobEmbedding.model_name == CANONICAL_EMBEDDING_MODEL_SHORT)
+                .scalar_subquery()
+            )
+            query = select(
+                JobPost.id, JobPost.title_raw, JobPost.description_raw
+            ).where(JobPost.id.not_in(embedded_sq))
             if job_ids:
                 query = query.where(JobPost.id.in_(job_ids))
 
-            result = await db.execute(query.limit(500))
-            jobs = result.scalars().all()
-
-            updated_count = 0
-
-            for job in jobs:
-                try:
-                    # Generate embedding
-                    text = f"{job.title_raw or ''} {job.description_raw or ''}"
-                    if text.strip():
-                        embedding = generate_embeddings([text])[0]
-                        job.embedding = embedding
-                        updated_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        "Failed to generate embedding for job %s: %s",
-                        job.id,
-                        str(e),
-                    )
-                    continue
+            result = await db.execute(
+                query.limit(500).execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
 
-            await db.commit()
+            batch_ids: list[int] = []
+            texts: list[str] = []
+            for job_id, title_raw, description in result:
+                text = f"{title_raw or ''} {description or ''}"
+                if text.strip():
+                    batch_ids.append(job_id)
+                    texts.append(text)
+
+            # One batched model call for the whole batch instead of one per job.
+            if not texts:
+                embeddings = []
+            elif settings.EMBEDDING_SERVICE_URL:
+                embeddings = await generate_embeddings_remote(
+                    texts, settings.EMBEDDING_SERVICE_URL
+                )
+            else:
+                embeddings = generate_embeddings(texts)
+
+            rows = [
+                {
+                    "job_id": job_id,
+                    "model_name": CANONICAL_EMBEDDING_MODEL_SHORT,
+                    "vector_json": embedding,
+                }
+                for job_id, embedding in zip(batch_ids, compact_embeddings(embeddings))
+            ]
+            updated_count = await _write_in_chunks(
+                db, insert(JobEmbedding), rows, "embedding"
+            )
 
             return {"status": "completed", "embeddings_updated": updated_count}
 
@@ -649,73 +1015,86 @@ async def _update_job_embeddings_async(
             await db.rollback()
             logger.error(f"Embedding updates failed: {str(e)}")
             raise
-        finally:
-            await db.close()
 
 
-async def _validate_job_data_async(
-    job_ids: List[int] = None,
-) -> Dict[str, Any]:
-    """Validate job data asynchronously"""
-    async for db in get_db():
-        try:
-            from sqlalchemy import select
-            from ..db.models import JobPost
-
-            # Get jobs to validate
-            query = select(JobPost)
-            if job_ids:
-                query = query.where(JobPost.id.in_(job_ids))
-
-            result = await db.execute(query.limit(1000))
-            jobs = result.scalars().all()
-
-            validation_results = {
-                "total_jobs": len(jobs),
-                "valid_jobs": 0,
-                "invalid_jobs": 0,
-                "validation_issues": [],
-            }
-
-            for job in jobs:
-                issues = []
-
-                # Check required fields
-                if not job.title_raw or len(job.title_raw.strip()) < 3:
-                    issues.append("Missing or too short title")
-
-                if not job.description_raw or (len(job.description_raw.strip()) < 50):
-                    issues.append("Missing or too short description")
-
-                if not job.url or not job.url.startswith(("http://", "https://")):
-                    issues.append("Invalid or missing URL")
+def _validate_job_data_sync(job_ids: List[int] = None) -> Dict[str, Any]:
+    """Validate job data synchronously
 
-                # Check data quality
-                if (
-                    job.salary_min
-                    and job.salary_max
-                    and job.salary_min > job.salary_max
-                ):
-                    issues.append("Invalid salary range")
+    Validation is one read-only query, so it runs directly in the task rather
+    than being handed to the worker event loop.
+    """
+    from sqlalchemy import case, func, or_, select
+    from ..db.models import JobPost
 
-                if issues:
-                    validation_results["invalid_jobs"] += 1
-                    validation_results["validation_issues"].append(
-                        {"job_id": job.id, "issues": issues}
-                    )
-                else:
-                    validation_results["valid_jobs"] += 1
+    db = SessionLocal()
+    try:
+        # Each rule is evaluated in SQL as a 0/1 flag so only ids and flags
+        # come back, never the full rows.
+        rules = {
+            "Missing or too short title": or_(
+                JobPost.title_raw.is_(None),
+                func.length(func.trim(JobPost.title_raw)) < 3,
+            ),
+            "Missing or too short description": or_(
+                JobPost.description_raw.is_(None),
+                func.length(func.trim(JobPost.description_raw)) < 50,
+            ),
+            "Invalid or missing URL": or_(
+                JobPost.url.is_(None),
+                ~or_(
+                    JobPost.url.startswith("http://"),
+                    JobPost.url.startswith("https://"),
+                ),
+            ),
+            # Zero salaries are treated as "not provided"
+            "Invalid salary range": (JobPost.salary_min != 0)
+            & (JobPost.salary_max != 0)
+            & (JobPost.salary_min > JobPost.salary_max),
+        }
+        labels = [f"rule_{i}" for i in range(len(rules))]
+
+        # Get jobs to validate
+        query = select(
+            JobPost.id,
+            *(
+                case((cond, 1), else_=0).label(label)
+                for label, cond in zip(labels, rules.values())
+            ),
+        )
+        if job_ids:
+            query = query.where(JobPost.id.in_(job_ids))
+        # Counts and issues both come from this one ordered read, so they
+        # always describe the same 1000 rows.
+        checked = db.execute(query.order_by(JobPost.id).limit(1000)).all()
+
+        messages = list(rules)
+        issue_counts = dict.fromkeys(messages, 0)
+        validation_issues = []
+        for row in checked:
+            issues = [msg for msg, flag in zip(messages, row[1:]) if flag]
+            if issues:
+                validation_issues.append({"job_id": row[0], "issues": issues})
+                for msg in issues:
+                    issue_counts[msg] += 1
+
+        validation_results = {
+            "total_jobs": len(checked),
+            "valid_jobs": len(checked) - len(validation_issues),
+            "invalid_jobs": len(validation_issues),
+            "issue_counts": issue_counts,
+            "validation_issues": validation_issues,
+        }
 
-            return {
-                "status": "completed",
-                "validation_results": validation_results,
-            }
+        return {
+            "status": "completed",
+            "validation_results": validation_results,
+        }
 
-        except Exception as e:
-            logger.error(f"Job data validation failed: {str(e)}")
-            raise
-        finally:
-            await db.close()
+    except Exception as e:
+        logger.error(f"Job data validation failed: {str(e)}")
+        raise
+    finally:
+        db.close()
 
 
 # Job Alert Processing Tasks
@@ -723,14 +1102,34 @@ async def _validate_job_data_async(
     bind=True,
     name="app.tasks.processing_tasks.process_job_alerts",
 )
-def process_job_alerts(self, frequency: str = "daily"):
+def process_job_alerts(
+    self,
+    frequency: str = "daily",
+    shard_index: int | None = None,
+    num_shards: int | None = None,
+):
     """
     Process job alerts and send notifications to users.
 
     Args:
         frequency: Alert frequency to process ("immediate", "daily", "weekly")
+        shard_index: Shard to process; with num_shards, only alerts whose
+            id % num_shards equals this index are handled.
+        num_shards: Total shard count. When omitted and ALERT_SHARDS > 1, the
+            run is fanned out as one task per shard instead.
     """
     try:
+        if num_shards is None and ALERT_SHARDS > 1:
+            group(
+                process_job_alerts.s(frequency, i, ALERT_SHARDS)
+                for i in range(ALERT_SHARDS)
+            ).apply_async()
+            return {
+                "status": "dispatched",
+                "frequency": frequency,
+                "shards": ALERT_SHARDS,
+            }
+
         self.update_state(
             state="PROGRESS",
             meta={
@@ -739,32 +1138,16 @@ def process_job_alerts(self, frequency: str = "daily"):
             },
         )
 
-        result = _process_job_alerts_sync(frequency)
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": (f"{frequency.title()} job alerts processed successfully"),
-                "progress": 100,
-                "result": result,
-            },
-        )
-
-        return result
+        return _process_job_alerts_sync(frequency, shard_index or 0, num_shards or 1)
 
     except Exception as e:
         logger.error(f"Job alert processing failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={
-                "status": f"Job alert processing failed: {str(e)}",
-                "progress": 0,
-            },
-        )
         raise
 
 
-def _process_job_alerts_sync(frequency: str) -> Dict[str, Any]:
+def _process_job_alerts_sync(
+    frequency: str, shard_index: int = 0, num_shards: int = 1
+) -> Dict[str, Any]:
     """Process job alerts synchronously (Celery-compatible)"""
     from sqlalchemy import select, and_
     from ..db.models import JobAlert, User, UserNotification
@@ -777,6 +1160,8 @@ def _process_job_alerts_sync(frequency: str) -> Dict[str, Any]:
         stmt = select(JobAlert).where(
             and_(JobAlert.is_active.is_(True), JobAlert.frequency == frequency)
         )
+        if num_shards > 1:
+            stmt = stmt.where(JobAlert.id % num_shards == shard_index)
         alerts = db.execute(stmt).scalars().all()
 
         alerts_processed = 0
@@ -796,37 +1181,24 @@ def _process_job_alerts_sync(frequency: str) -> Dict[str, Any]:
             try:
                 filters = alert.filters or {}
 
-                # Search for matching jobs
+                # Only jobs first seen inside the window are candidates; the
+                # cutoff is applied in SQL rather than on the fetched page.
                 matching_jobs_resp = search_jobs(
                     db,
                     q=alert.query,
                     location=filters.get("location"),
                     seniority=filters.get("seniority"),
+                    min_first_seen=cutoff_time,
                 )
 
                 if isinstance(matching_jobs_resp, dict):
-                    matching_jobs = (
+                    new_jobs = (
                         matching_jobs_resp.get("jobs")
                         or matching_jobs_resp.get("results")
                         or []
                     )
                 else:
-                    matching_jobs = matching_jobs_resp or []
-
-                # Filter for new jobs only
-                new_jobs = [
-                    job
-                    for job in matching_jobs
-                    if job.get("first_seen")
-                    and (
-                        job["first_seen"]
-                        if isinstance(job["first_seen"], datetime)
-                        else datetime.fromisoformat(
-                            str(job["first_seen"]).replace("Z", "")
-                        )
-                    )
-                    > cutoff_time
-                ]
+                    new_jobs = matching_jobs_resp or []
 
                 if new_jobs:
                     # Get user for this alert
@@ -900,6 +1272,7 @@ def _process_job_alerts_sync(frequency: str) -> Dict[str, Any]:
         return {
             "status": "completed",
             "frequency": frequency,
+            "shard": shard_index,
             "alerts_processed": alerts_processed,
             "notifications_sent": notifications_sent,
             "processed_at": datetime.utcnow().isoformat(),
@@ -0,0 +1,15 @@
+"""Optional PROGRESS reporting for long-running Celery tasks."""
+
+from ..core.config import settings
+
+
+def report_progress(task, status: str, progress: int = 0) -> None:
+    """Publish a PROGRESS state for ``task`` when progress tracking is enabled.
+
+    Each call is a result-backend write, so it is skipped unless
+    ``CELERY_TRACK_PROGRESS`` is set. Terminal SUCCESS/FAILURE states are
+    recorded by Celery from the task's return value or exception.
+    """
+    if not settings.CELERY_TRACK_PROGRESS:
+        return
+    task.update_state(state="PROGRESS", meta={"status": status, "progress": progress})
@@ -1,56 +1,150 @@
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, Any
+import os
+import threading
+import weakref
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterable
+
+import httpx
+from celery import signals
+from sqlalchemy import delete, select
 
 from ..core.celery_app import celery_app
-from ..db.database import get_db
+from ..core.locks import get_redis_client, skip_if_running
+from ..db.database import session_scope
+from ..db.models import JobPost
 from ..services.automated_workflow_service import automated_workflow_service
 from ..services.scraper_service import scraper_service
+from .progress import report_progress
+from .worker_loop import run_in_worker_loop
 
 logger = logging.getLogger(__name__)
 
+# Sites scraped or probed at once; unbounded fan-out floods sockets and the
+# executor as the site list grows.
+SCRAPER_MAX_CONCURRENCY = int(os.getenv("SCRAPER_MAX_CONCURRENCY", "8"))
+
+# Per-site ceilings (seconds) so one slow site does not stall the rest of
+# the run. Scrapes also pass theirs to the spider as a crawl deadline.
+SCRAPER_SITE_TIMEOUT = float(os.getenv("SCRAPER_SITE_TIMEOUT", "600"))
+SCRAPER_PROBE_TIMEOUT = float(os.getenv("SCRAPER_PROBE_TIMEOUT", "60"))
+
+# Network flakes worth retrying with backoff; anything else fails the task at
+# once and is logged by Celery.
+TRANSIENT_SCRAPER_ERRORS = (ConnectionError, TimeoutError, httpx.TransportError)
+SCRAPER_RETRY_OPTIONS = {
+    "retry_backoff": True,
+    "retry_backoff_max": 300,
+    "retry_jitter": True,
+    "max_retries": 5,
+}
+
+# Rows removed per DELETE statement by cleanup_old_jobs.
+CLEANUP_DELETE_BATCH_SIZE = int(os.getenv("CLEANUP_DELETE_BATCH_SIZE", "5000"))
+
+# Config validations are requested on demand and often repeated while a
+# config is being edited; repeat calls within this many seconds reuse the
+# cached result instead of re-hitting the site. The beat-driven health check
+# runs hours apart and is never cached. Set to 0 to disable.
+SCRAPER_PROBE_CACHE_TTL = int(os.getenv("SCRAPER_PROBE_CACHE_TTL", "120"))
+
+
+# Pooled probe clients, one per event loop, so repeated health checks reuse
+# TCP/TLS connections instead of handshaking per site. An AsyncClient is
+# bound to the loop it first ran on, and under the threads pool every pool
+# thread drives its own loop (see worker_loop.py).
+_http_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_http_clients_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the probe client for the running loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    with _http_clients_lock:
+        client = _http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=SCRAPER_MAX_CONCURRENCY * 2,
+                    keepalive_expiry=30.0,
+                ),
+            )
+            _http_clients[loop] = client
+        return client
+
+
+@signals.worker_shutdown.connect
+@signals.worker_process_shutdown.connect
+def _close_http_clients(**kwargs) -> None:
+    """Close every probe client on the loop it belongs to."""
+    with _http_clients_lock:
+        clients = list(_http_clients.items())
+        _http_clients.clear()
+    for loop, client in clients:
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(5)
+            elif not loop.is_closed():
+                loop.run_until_complete(client.aclose())
+        except Exception as exc:
+            logger.warning("Failed to close scraper probe client: %s", exc)
 
-@celery_app.task(bind=True, name="app.tasks.scraper_tasks.test_all_scrapers")
-def health_check_all_scrapers(self):
-    """
-    Test all scraper configurations for health monitoring
+
+def _probe_cache_key(prefix: str, payload: Any) -> str:
+    digest = hashlib.sha1(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def _cached_probe(key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the result cached under ``key`` or compute and cache it.
+
+    Redis is optional: lookup or store failures fall back to computing.
     """
+    if SCRAPER_PROBE_CACHE_TTL <= 0:
+        return compute()
     try:
-        self.update_state(
-            state="PROGRESS",
-            meta={"status": "Starting scraper health check", "progress": 0},
-        )
+        cached = get_redis_client().get(key)
+        if cached:
+            return json.loads(cached)
+    except Exception as exc:  # pragma: no cover - redis optional
+        logger.warning("Redis unavailable; skipping probe cache: %s", exc)
 
-        result = asyncio.run(_test_scrapers_async())
-
-        # Calculate health score
-        total_scrapers = len(result.get("detailed_results", {}))
-        successful_scrapers = sum(
-            1
-            for test_result in result.get("detailed_results", {}).values()
-            if test_result.get("status") == "success"
+    result = compute()
+    try:
+        get_redis_client().setex(
+            key, SCRAPER_PROBE_CACHE_TTL, json.dumps(result, default=str)
         )
+    except Exception as exc:  # pragma: no cover - redis optional
+        logger.warning("Failed to cache probe result %s: %s", key, exc)
+    return result
 
-        health_score = successful_scrapers / total_scrapers if total_scrapers > 0 else 0
 
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Scraper health check completed",
-                "progress": 100,
-                "health_score": health_score,
-                "result": result,
-            },
-        )
+@celery_app.task(
+    bind=True, name="app.tasks.scraper_tasks.test_all_scrapers", ignore_result=True
+)
+@skip_if_running("nextstep:test_all_scrapers", ttl_seconds=60 * 60)
+def health_check_all_scrapers(self):
+    """
+    Test all scraper configurations for health monitoring
+    """
+    try:
+        report_progress(self, "Starting scraper health check")
 
-        return result
+        scraper_configs = run_in_worker_loop(
+            automated_workflow_service._get_scraper_configs()
+        )
+        return run_in_worker_loop(_test_scrapers_async(scraper_configs))
 
     except Exception as e:
         logger.error(f"Scraper health check failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"Scraper health check failed: {str(e)}", "progress": 0},
-        )
         raise
 
 
@@ -65,69 +159,41 @@ except Exception:
     pass
 
 
-@celery_app.task(bind=True, name="app.tasks.scraper_tasks.run_single_scraper")
+@celery_app.task(
+    bind=True,
+    name="app.tasks.scraper_tasks.run_single_scraper",
+    autoretry_for=TRANSIENT_SCRAPER_ERRORS,
+    **SCRAPER_RETRY_OPTIONS,
+)
 def run_single_scraper(self, site_name: str):
     """
     Run a single scraper for a specific site
     """
-    try:
-        self.update_state(
-            state="PROGRESS",
-            meta={"status": f"Starting scraper for {site_name}", "progress": 0},
-        )
-
-        result = asyncio.run(_run_single_scraper_async(site_name))
+    report_progress(self, f"Starting scraper for {site_name}")
 
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": f"Scraper for {site_name} completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
-
-        return result
-
-    except Exception as e:
-        logger.error(f"Scraper for {site_name} failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"Scraper for {site_name} failed: {str(e)}", "progress": 0},
-        )
-        raise
+    return run_in_worker_loop(_run_single_scraper_async(site_name))
 
 
-@celery_app.task(bind=True, name="app.tasks.scraper_tasks.run_all_scrapers")
+@celery_app.task(
+    bind=True,
+    name="app.tasks.scraper_tasks.run_all_scrapers",
+    autoretry_for=TRANSIENT_SCRAPER_ERRORS,
+    **SCRAPER_RETRY_OPTIONS,
+)
+@skip_if_running("nextstep:run_all_scrapers", ttl_seconds=60 * 60)
 def run_all_scrapers(self):
     """
     Run all configured scrapers
     """
-    try:
-        self.update_state(
-            state="PROGRESS", meta={"status": "Starting all scrapers", "progress": 0}
-        )
-
-        result = asyncio.run(_run_all_scrapers_async())
+    report_progress(self, "Starting all scrapers")
 
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "All scrapers completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
-
-        return result
-
-    except Exception as e:
-        logger.error(f"All scrapers execution failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"All scrapers execution failed: {str(e)}", "progress": 0},
+    return run_in_worker_loop(
+        _run_all_scrapers_async(
+            lambda done, total: report_progress(
+                self, f"Scraped {done}/{total} sites", done * 100 // total
+            )
         )
-        raise
+    )
 
 
 @celery_app.task(bind=True, name="app.tasks.scraper_tasks.migrate_scraper_data")
@@ -136,29 +202,14 @@ def migrate_scraper_data(self):
     Migrate scraped data from SQLite to PostgreSQL
     """
     try:
-        self.update_state(
-            state="PROGRESS", meta={"status": "Starting data migration", "progress": 0}
-        )
+        report_progress(self, "Starting data migration")
 
-        result = asyncio.run(_migrate_data_async())
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Data migration completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
+        result = run_in_worker_loop(_migrate_data_async())
 
         return result
 
     except Exception as e:
         logger.error(f"Data migration failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"Data migration failed: {str(e)}", "progress": 0},
-        )
         raise
 
 
@@ -168,85 +219,77 @@ def validate_scraper_config(self, site_name: str, config: Dict[str, Any]):
     Validate a scraper configuration
     """
     try:
-        self.update_state(
-            state="PROGRESS",
-            meta={"status": f"Validating config for {site_name}", "progress": 0},
-        )
+        report_progress(self, f"Validating config for {site_name}")
 
-        result = asyncio.run(_validate_config_async(site_name, config))
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": f"Config validation for {site_name} completed",
-                "progress": 100,
-                "result": result,
-            },
+        return _cached_probe(
+            _probe_cache_key("scraper_config_validation", [site_name, config]),
+            lambda: run_in_worker_loop(_validate_config_async(site_name, config)),
         )
 
-        return result
-
     except Exception as e:
         logger.error(f"Config validation for {site_name} failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={
-                "status": f"Config validation for {site_name} failed: {str(e)}",
-                "progress": 0,
-            },
-        )
         raise
 
 
-@celery_app.task(bind=True, name="app.tasks.scraper_tasks.cleanup_old_jobs")
+@celery_app.task(
+    bind=True, name="app.tasks.scraper_tasks.cleanup_old_jobs", ignore_result=True
+)
 def cleanup_old_jobs(self, days_old: int = 30):
     """
     Clean up old job postings from the database
     """
     try:
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "status": f"Starting cleanup of jobs older than {days_old} days",
-                "progress": 0,
-            },
-        )
+        report_progress(self, f"Starting cleanup of jobs older than {days_old} days")
 
-        result = asyncio.run(_cleanup_old_jobs_async(days_old))
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Cleanup completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
+        result = run_in_worker_loop(_cleanup_old_jobs_async(days_old))
 
         return result
 
     except Exception as e:
         logger.error(f"Job cleanup failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"Job cleanup failed: {str(e)}", "progress": 0},
-        )
         raise
 
 
 # Async helper functions
-async def _test_scrapers_async() -> Dict[str, Any]:
+async def _gather_bounded(
+    coros: Iterable[Awaitable[Any]], return_exceptions: bool = False
+) -> list:
+    """asyncio.gather with at most SCRAPER_MAX_CONCURRENCY awaitables running."""
+    semaphore = asyncio.Semaphore(SCRAPER_MAX_CONCURRENCY)
+
+    async def _guarded(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(
+        *(_guarded(coro) for coro in coros), return_exceptions=return_exceptions
+    )
+
+
+async def _test_scrapers_async(
+    scraper_configs: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
     """Test all scrapers asynchronously"""
     try:
-        # Get scraper configs
-        scraper_configs = await automated_workflow_service._get_scraper_configs()
+        if scraper_configs is None:
+            scraper_configs = await automated_workflow_service._get_scraper_configs()
 
-        test_results = {}
-        for site_name, config in scraper_configs.items():
-            test_result = await automated_workflow_service._test_scraper(
-                site_name, config
-            )
-            test_results[site_name] = test_result
+        async def _probe(site_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return await asyncio.wait_for(
+                    automated_workflow_service._test_scraper(
+                        site_name, config, client=_get_http_client()
+                    ),
+                    timeout=SCRAPER_PROBE_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                return {"site_name": site_name, "status": "timeout"}
+
+        # Each probe is a network round-trip, so run them concurrently.
+        outcomes = await _gather_bounded(
+            _probe(site_name, config) for site_name, config in scraper_configs.items()
+        )
+        test_results = dict(zip(scraper_configs, outcomes))
 
         # Calculate summary
         total_scrapers = len(test_results)
@@ -281,7 +324,19 @@ async def _run_single_scraper_async(site_name: str) -> Dict[str, Any]:
         raise
 
 
-async def _run_all_scrapers_async() -> Dict[str, Any]:
+def _log_late_scrape(site_name: str, scrape: asyncio.Future) -> None:
+    """Record how a scrape that outlived its timeout eventually ended."""
+    if scrape.cancelled():
+        return
+    if scrape.exception() is not None:
+        logger.error(f"Timed-out scraper for {site_name} failed: {scrape.exception()}")
+    else:
+        logger.info(f"Timed-out scraper for {site_name} finished late")
+
+
+async def _run_all_scrapers_async(
+    on_progress: Callable[[int, int], None] | None = None,
+) -> Dict[str, Any]:
     """Run all scrapers asynchronously"""
     try:
         # Get scraper configs
@@ -289,15 +344,43 @@ async def _run_all_scrapers_async() -> Dict[str, Any]:
 
         results = {}
         total_jobs_scraped = 0
-
-        for site_name in scraper_configs.keys():
+        semaphore = asyncio.Semaphore(SCRAPER_MAX_CONCURRENCY)
+
+        async def _scrape(site_name: str):
+            await semaphore.acquire()
+            scrape = asyncio.ensure_future(
+                scraper_service.run_scraper_for_site(
+                    site_name, timeout=SCRAPER_SITE_TIMEOUT
+                )
+            )
+            # The spider runs in an executor thread that cannot be cancelled,
+            # so the slot is held until it really finishes; a timeout only
+            # stops waiting for it.
+            scrape.add_done_callback(lambda _: semaphore.release())
             try:
-                site_result = await scraper_service.run_scraper_for_site(site_name)
+                return site_name, await asyncio.wait_for(
+                    asyncio.shield(scrape), timeout=SCRAPER_SITE_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                logger.error(f"Scraper for {site_name} timed out, still running")
+                scrape.add_done_callback(partial(_log_late_scrape, site_name))
+                return site_name, {"status": "timed_out_still_running"}
+            except Exception as e:
+                return site_name, e
+
+        # Sites are independent and I/O-bound; scrape them concurrently and
+        # record each one as soon as it finishes.
+        pending = [_scrape(site_name) for site_name in scraper_configs]
+        for done, next_result in enumerate(asyncio.as_completed(pending), start=1):
+            site_name, site_result = await next_result
+            if isinstance(site_result, Exception):
+                logger.error(f"Scraper failed for {site_name}: {str(site_result)}")
+                results[site_name] = {"status": "failed", "error": str(site_result)}
+            else:
                 results[site_name] = site_result
                 total_jobs_scraped += site_result.get("jobs_scraped", 0)
-            except Exception as e:
-                logger.error(f"Scraper failed for {site_name}: {str(e)}")
-                results[site_name] = {"status": "failed", "error": str(e)}
+            if on_progress:
+                on_progress(done, len(pending))
 
         return {
             "status": "completed",
@@ -325,7 +408,9 @@ async def _validate_config_async(
 ) -> Dict[str, Any]:
     """Validate scraper configuration asynchronously"""
     try:
-        test_result = await automated_workflow_service._test_scraper(site_name, config)
+        test_result = await automated_workflow_service._test_scraper(
+            site_name, config, client=_get_http_client()
+        )
 
         validation_result = {
             "site_name": site_name,
@@ -350,21 +435,36 @@ async def _validate_config_async(
 
 async def _cleanup_old_jobs_async(days_old: int) -> Dict[str, Any]:
     """Clean up old jobs asynchronously"""
-    async for db in get_db():
+    async with session_scope() as db:
         try:
-            from datetime import datetime, timedelta
-            from sqlalchemy import delete
-            from ..db.models import JobPost
-
             # Calculate cutoff date
             cutoff_date = datetime.utcnow() - timedelta(days=days_old)
 
-            # Delete old jobs
-            delete_stmt = delete(JobPost).where(JobPost.first_seen < cutoff_date)
-            result = await db.execute(delete_stmt)
-            await db.commit()
-
-            deleted_count = result.rowcount
+            # Delete old jobs in bounded batches, committing each one, so a
+            # large backlog never holds row locks or WAL for one huge
+            # transaction.
+            batch_ids = (
+                select(JobPost.id)
+                .where(JobPost.first_seen < cutoff_date)
+                .limit(CLEANUP_DELETE_BATCH_SIZE)
+            )
+            # The session holds no JobPost objects, so skip ORM sync of deleted
+            # rows (which would add a SELECT per batch).
+            delete_stmt = (
+                delete(JobPost)
+                .where(JobPost.id.in_(batch_ids))
+                .execution_options(synchronize_session=False)
+            )
+            deleted_count = 0
+            while True:
+                result = await db.execute(delete_stmt)
+                await db.commit()
+                batch_deleted = result.rowcount or 0
+                deleted_count += batch_deleted
+                if batch_deleted < CLEANUP_DELETE_BATCH_SIZE:
+                    break
+                # Let other coroutines on the worker loop run between batches.
+                await asyncio.sleep(0)
 
             return {
                 "status": "completed",
@@ -376,5 +476,3 @@ async def _cleanup_old_jobs_async(days_old: int) -> Dict[str, Any]:
             await db.rollback()
             logger.error(f"Job cleanup failed: {str(e)}")
             raise
-        finally:
-            await db.close()
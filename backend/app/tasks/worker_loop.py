@@ -0,0 +1,41 @@
+"""Long-lived event loops shared by the Celery task modules.
+
+Tasks hand their coroutines to a long-lived loop instead of paying for
+``asyncio.run`` (a fresh loop, default executor and connections) on every
+invocation.
+"""
+
+import asyncio
+import os
+import threading
+
+_worker_loops = threading.local()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the calling thread's long-lived event loop, started on first use.
+
+    The loop runs in a daemon thread so tasks can submit coroutines without
+    building and tearing down a loop per call. Each calling thread gets its
+    own loop: under the prefork pool that is one per process, and under the
+    threads pool one per pool thread, so a coroutine making blocking calls
+    (sync DB sessions, sync service code) only holds up its own task. The
+    loop is recreated after a fork, since the thread driving the parent's
+    loop does not survive into the child.
+    """
+    loop = getattr(_worker_loops, "loop", None)
+    if loop is None or _worker_loops.pid != os.getpid():
+        loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=loop.run_forever,
+            name=f"celery-worker-loop-{threading.current_thread().name}",
+            daemon=True,
+        ).start()
+        _worker_loops.loop = loop
+        _worker_loops.pid = os.getpid()
+    return loop
+
+
+def run_in_worker_loop(coro):
+    """Run ``coro`` on the calling thread's worker loop and block until it returns."""
+    return asyncio.run_coroutine_threadsafe(coro, get_worker_loop()).result()
@@ -1,67 +1,80 @@
-import asyncio
 import logging
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
 from ..core.celery_app import celery_app
-from ..db.database import get_db, SessionLocal
+from ..core.locks import skip_if_running
+from ..db.database import session_scope, SessionLocal
 from ..services.automated_workflow_service import automated_workflow_service
 from ..services.processing_log_service import log_processing_event
+from .progress import report_progress
+from .worker_loop import run_in_worker_loop
 
 logger = logging.getLogger(__name__)
 
 
-@celery_app.task(bind=True, name="app.tasks.workflow_tasks.run_daily_workflow")
+@celery_app.task(
+    name="app.tasks.workflow_tasks.record_processing_event", ignore_result=True
+)
+def record_processing_event(
+    process_type: str,
+    status: str,
+    message: Optional[str] = None,
+    details: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Write a ProcessingLog row on behalf of another task."""
+    db = SessionLocal()
+    try:
+        log_processing_event(
+            db,
+            process_type=process_type,
+            status=status,
+            message=message,
+            details=details,
+        )
+    finally:
+        db.close()
+
+
+def _record_event(**event: Any) -> None:
+    """Queue a ProcessingLog write so the calling task can return at once.
+
+    Falls back to writing inline when the event cannot be queued.
+    """
+    try:
+        record_processing_event.delay(**event)
+    except Exception as exc:
+        logger.warning("Could not queue processing event, writing inline: %s", exc)
+        record_processing_event(**event)
+
+
+@celery_app.task(
+    bind=True, name="app.tasks.workflow_tasks.run_daily_workflow", ignore_result=True
+)
+@skip_if_running("nextstep:run_daily_workflow", ttl_seconds=60 * 60)
 def run_daily_workflow(self):
     """
     Run the complete daily automated workflow
     """
     try:
-        # Update task status
-        self.update_state(
-            state="PROGRESS", meta={"status": "Starting daily workflow", "progress": 0}
-        )
+        report_progress(self, "Starting daily workflow")
 
         # Run the async workflow
-        result = asyncio.run(_run_async_workflow())
-
-        # Update final status
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Daily workflow completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
+        result = run_in_worker_loop(_run_async_workflow())
 
-        db = SessionLocal()
-        try:
-            log_processing_event(
-                db,
-                process_type="daily_workflow",
-                status="success",
-                message="Daily workflow completed",
-                details={"result": result},
-            )
-        finally:
-            db.close()
+        _record_event(
+            process_type="daily_workflow",
+            status="success",
+            message="Daily workflow completed",
+            details={"result": result},
+        )
         return result
 
     except Exception as e:
         logger.error(f"Daily workflow failed: {str(e)}")
-        db = SessionLocal()
-        try:
-            log_processing_event(
-                db,
-                process_type="daily_workflow",
-                status="error",
-                message=str(e),
-            )
-        finally:
-            db.close()
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"Daily workflow failed: {str(e)}", "progress": 0},
+        _record_event(
+            process_type="daily_workflow",
+            status="error",
+            message=str(e),
         )
         raise
 
@@ -72,29 +85,14 @@ def run_scraper_stage(self):
     Run only the scraper testing and execution stage
     """
     try:
-        self.update_state(
-            state="PROGRESS", meta={"status": "Starting scraper stage", "progress": 0}
-        )
-
-        result = asyncio.run(_run_async_scraper_stage())
+        report_progress(self, "Starting scraper stage")
 
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Scraper stage completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
+        result = run_in_worker_loop(_run_async_scraper_stage())
 
         return result
 
     except Exception as e:
         logger.error(f"Scraper stage failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"Scraper stage failed: {str(e)}", "progress": 0},
-        )
         raise
 
 
@@ -104,30 +102,14 @@ def run_processing_stage(self):
     Run only the data processing and cleaning stage
     """
     try:
-        self.update_state(
-            state="PROGRESS",
-            meta={"status": "Starting processing stage", "progress": 0},
-        )
+        report_progress(self, "Starting processing stage")
 
-        result = asyncio.run(_run_async_processing_stage())
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Processing stage completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
+        result = run_in_worker_loop(_run_async_processing_stage())
 
         return result
 
     except Exception as e:
         logger.error(f"Processing stage failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"Processing stage failed: {str(e)}", "progress": 0},
-        )
         raise
 
 
@@ -137,82 +119,46 @@ def run_learning_stage(self):
     Run only the knowledge extraction and learning stage
     """
     try:
-        self.update_state(
-            state="PROGRESS", meta={"status": "Starting learning stage", "progress": 0}
-        )
+        report_progress(self, "Starting learning stage")
 
-        result = asyncio.run(_run_async_learning_stage())
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Learning stage completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
+        result = run_in_worker_loop(_run_async_learning_stage())
 
         return result
 
     except Exception as e:
         logger.error(f"Learning stage failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"Learning stage failed: {str(e)}", "progress": 0},
-        )
         raise
 
 
-@celery_app.task(bind=True, name="app.tasks.workflow_tasks.generate_daily_insights")
+@celery_app.task(
+    bind=True,
+    name="app.tasks.workflow_tasks.generate_daily_insights",
+    ignore_result=True,
+)
+@skip_if_running("nextstep:generate_daily_insights", ttl_seconds=60 * 60)
 def generate_daily_insights(self):
     """
     Generate daily market insights and metrics
     """
     try:
-        self.update_state(
-            state="PROGRESS",
-            meta={"status": "Starting insights generation", "progress": 0},
-        )
+        report_progress(self, "Starting insights generation")
 
-        result = asyncio.run(_run_async_insights_generation())
+        result = run_in_worker_loop(_run_async_insights_generation())
 
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Insights generation completed successfully",
-                "progress": 100,
-                "result": result,
-            },
+        _record_event(
+            process_type="daily_insights",
+            status="success",
+            message="Daily insights completed",
+            details={"result": result},
         )
-
-        db = SessionLocal()
-        try:
-            log_processing_event(
-                db,
-                process_type="daily_insights",
-                status="success",
-                message="Daily insights completed",
-                details={"result": result},
-            )
-        finally:
-            db.close()
         return result
 
     except Exception as e:
         logger.error(f"Insights generation failed: {str(e)}")
-        db = SessionLocal()
-        try:
-            log_processing_event(
-                db,
-                process_type="daily_insights",
-                status="error",
-                message=str(e),
-            )
-        finally:
-            db.close()
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"Insights generation failed: {str(e)}", "progress": 0},
+        _record_event(
+            process_type="daily_insights",
+            status="error",
+            message=str(e),
         )
         raise
 
@@ -223,89 +169,49 @@ def run_optimization_stage(self):
     Run model optimization stage
     """
     try:
-        self.update_state(
-            state="PROGRESS",
-            meta={"status": "Starting optimization stage", "progress": 0},
-        )
+        report_progress(self, "Starting optimization stage")
 
-        result = asyncio.run(_run_async_optimization_stage())
-
-        self.update_state(
-            state="SUCCESS",
-            meta={
-                "status": "Optimization stage completed successfully",
-                "progress": 100,
-                "result": result,
-            },
-        )
+        result = run_in_worker_loop(_run_async_optimization_stage())
 
         return result
 
     except Exception as e:
         logger.error(f"Optimization stage failed: {str(e)}")
-        self.update_state(
-            state="FAILURE",
-            meta={"status": f"Optimization stage failed: {str(e)}", "progress": 0},
-        )
         raise
 
 
 # Async helper functions
 async def _run_async_workflow() -> Dict[str, Any]:
     """Run the complete workflow asynchronously"""
-    async for db in get_db():
-        try:
-            result = await automated_workflow_service.run_complete_workflow(db)
-            return result
-        finally:
-            await db.close()
+    async with session_scope() as db:
+        return await automated_workflow_service.run_complete_workflow(db)
 
 
 async def _run_async_scraper_stage() -> Dict[str, Any]:
     """Run scraper stage asynchronously"""
-    async for db in get_db():
-        try:
-            result = await automated_workflow_service._run_scraper_stage(db)
-            return result
-        finally:
-            await db.close()
+    async with session_scope() as db:
+        return await automated_workflow_service._run_scraper_stage(db)
 
 
 async def _run_async_processing_stage() -> Dict[str, Any]:
     """Run processing stage asynchronously"""
-    async for db in get_db():
-        try:
-            result = await automated_workflow_service._run_processing_stage(db)
-            return result
-        finally:
-            await db.close()
+    async with session_scope() as db:
+        return await automated_workflow_service._run_processing_stage(db)
 
 
 async def _run_async_learning_stage() -> Dict[str, Any]:
     """Run learning stage asynchronously"""
-    async for db in get_db():
-        try:
-            result = await automated_workflow_service._run_learning_stage(db)
-            return result
-        finally:
-            await db.close()
+    async with session_scope() as db:
+        return await automated_workflow_service._run_learning_stage(db)
 
 
 async def _run_async_insights_generation() -> Dict[str, Any]:
     """Run insights generation asynchronously"""
-    async for db in get_db():
-        try:
-            result = await automated_workflow_service._generate_insights(db)
-            return result
-        finally:
-            await db.close()
+    async with session_scope() as db:
+        return await automated_workflow_service._generate_insights(db)
 
 
 async def _run_async_optimization_stage() -> Dict[str, Any]:
     """Run optimization stage asynchronously"""
-    async for db in get_db():
-        try:
-            result = await automated_workflow_service._run_optimization_stage(db)
-            return result
-        finally:
-            await db.close()
+    async with session_scope() as db:
+        return await automated_workflow_service._run_optimization_stage(db)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Request, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from ..services.search import search_jobs
 from ..services.recommend import transitions_for
 from ..services.lmi import get_weekly_insights, get_attachment_companies
@@ -6,14 +7,139 @@ from ..normalization.titles import get_careers_for_degree
 from ..db.database import get_db
 from ..core.config import settings
 from sqlalchemy.orm import Session
+from functools import lru_cache
+from typing import Any, Callable
+import asyncio
 import re
 import logging
+import threading
+import time
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Message text is user-controlled and the open-ended captures below backtrack
+# quadratically in ``re``; RE2 matches them in linear time when installed.
+# RE2's \w and \s are ASCII-only, so its patterns spell out the Unicode
+# classes ``re`` uses for them (e.g. "café", "Ngũgĩ" stay whole words).
+if re2 is not None:
+    _regex = re2
+    _WORD = r"[\pL\pN_]"
+    _SPACE = r"[\s\v\pZ\x{1c}-\x{1f}\x{85}]"
+else:
+    _regex = re
+    _WORD = r"\w"
+    _SPACE = r"\s"
+_WORDS = rf"({_WORD}+(?:{_SPACE}+{_WORD}+)*)"
+
+# Compiled once; intent parsing runs these against every inbound message.
+_DEGREE_PATTERNS = [
+    _regex.compile(rf"i studied {_WORDS}"),
+    _regex.compile(rf"degree in {_WORDS}"),
+    _regex.compile(rf"{_WORDS} graduate"),
+    _regex.compile(rf"background in {_WORDS}"),
+]
+# Substring keywords per intent, matched in a single pass over the message.
+_INTENT_KEYWORD_RE = re.compile(
+    r"(?P<transition>transition)"
+    r"|(?P<attachments>attachment|intern|graduate program)"
+    r"|(?P<market_insights>market|trends|insights|hiring)"
+    r"|(?P<salary>salary|pay|compensation|earnings)"
+)
+KENYAN_LOCATIONS = (
+    "nairobi",
+    "mombasa",
+    "kisumu",
+    "nakuru",
+    "eldoret",
+    "thika",
+    "malindi",
+    "kitale",
+    "garissa",
+    "kakamega",
+    "machakos",
+    "meru",
+    "nyeri",
+    "kericho",
+)
+# One alternation scans the message once instead of once per town.
+_LOCATION_RE = re.compile(r"\b(" + "|".join(KENYAN_LOCATIONS) + r")\b")
+# A message sharing no character with these first letters cannot name a town.
+_LOCATION_FIRST_CHARS = frozenset(location[0] for location in KENYAN_LOCATIONS)
+_SALARY_ROLE_PATTERNS = [
+    _regex.compile(rf"{_WORDS}{_SPACE}+salary"),
+    _regex.compile(rf"salary{_SPACE}+for{_SPACE}+{_WORDS}"),
+    _regex.compile(rf"how much do {_WORDS} earn"),
+]
+
+
+# Replies built from DB lookups reuse results for a few minutes; repeated
+# questions and Twilio retries then skip the queries entirely.
+WHATSAPP_LOOKUP_TTL_SECONDS = 300
+_WHATSAPP_LOOKUP_MAX_ENTRIES = 256
+_lookup_cache: dict[tuple, tuple[float, Any]] = {}
+
+
+def _cached_lookup(key: tuple, compute: Callable[[], Any]) -> Any:
+    """Return the unexpired value cached under ``key`` or compute and store it."""
+    now = time.monotonic()
+    hit = _lookup_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    value = compute()
+    if key not in _lookup_cache and len(_lookup_cache) >= _WHATSAPP_LOOKUP_MAX_ENTRIES:
+        # Dicts keep insertion order, so this drops the oldest entry.
+        _lookup_cache.pop(next(iter(_lookup_cache)))
+    _lookup_cache[key] = (now + WHATSAPP_LOOKUP_TTL_SECONDS, value)
+    return value
+
+
+@lru_cache(maxsize=512)
+def _careers_for_degree(degree: str) -> tuple[str, ...]:
+    # Static mapping, so results never go stale; callers pass the degree
+    # lowercased so "Economics" and "economics" share an entry.
+    return tuple(get_careers_for_degree(degree))
+
+
+_twilio_client = None
+_twilio_client_credentials: tuple[str, str] | None = None
+_twilio_client_lock = threading.Lock()
+
+
+def _get_twilio_client():
+    """Return the process-wide Twilio client, created on first use.
+
+    One client keeps its HTTP session, so sends reuse pooled keep-alive
+    connections instead of a fresh TLS handshake each time. It is rebuilt
+    if the configured credentials change.
+    """
+    global _twilio_client, _twilio_client_credentials
+    credentials = (settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+    with _twilio_client_lock:
+        if _twilio_client is None or _twilio_client_credentials != credentials:
+            from twilio.rest import Client
+
+            _twilio_client = Client(*credentials)
+            _twilio_client_credentials = credentials
+        return _twilio_client
+
 
 async def send_whatsapp_message(to_number: str, message: str) -> bool:
+    """
+    Send a WhatsApp message via Twilio API without blocking the event loop.
+
+    The Twilio client is synchronous, so the request runs in a worker thread.
+    See ``send_whatsapp_message_sync`` for arguments and return value.
+    """
+    return await asyncio.to_thread(send_whatsapp_message_sync, to_number, message)
+
+
+def send_whatsapp_message_sync(to_number: str, message: str) -> bool:
     """
     Send a WhatsApp message via Twilio API.
 
@@ -35,9 +161,7 @@ async def send_whatsapp_message(to_number: str, message: str) -> bool:
         return False
 
     try:
-        from twilio.rest import Client
-
-        client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+        client = _get_twilio_client()
 
         # Ensure phone numbers are in WhatsApp format
         from_number = settings.TWILIO_WHATSAPP_FROM
@@ -64,45 +188,49 @@ async def send_whatsapp_message(to_number: str, message: str) -> bool:
 
 def parse_intent(text: str) -> dict:
     """Parse user intent from WhatsApp message"""
+    # Cached as item tuples; each caller gets its own dict to work with.
+    return dict(_parse_intent_items(text))
+
+
+@lru_cache(maxsize=1024)
+def _parse_intent_items(text: str) -> tuple[tuple[str, Any], ...]:
+    # Twilio retries and repeated questions resend identical bodies, so the
+    # regex pipeline below runs once per distinct message.
+    return tuple(_parse_intent(text).items())
+
+
+def _parse_intent(text: str) -> dict:
     text_lower = text.lower().strip()
 
     # Degree/study patterns
-    degree_patterns = [
-        r"i studied (\w+(?:\s+\w+)*)",
-        r"degree in (\w+(?:\s+\w+)*)",
-        r"(\w+(?:\s+\w+)*) graduate",
-        r"background in (\w+(?:\s+\w+)*)",
-    ]
-
-    for pattern in degree_patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in _DEGREE_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             return {"intent": "degree_careers", "degree": match.group(1).strip()}
 
+    # One scan collects every keyword group present; the checks below keep
+    # the original precedence between groups.
+    keyword_groups = {m.lastgroup for m in _INTENT_KEYWORD_RE.finditer(text_lower)}
+
     # Transition patterns
-    if "transition" in text_lower:
+    if "transition" in keyword_groups:
         current_role = (
             text.split("transition", 1)[1].strip() if "transition" in text else ""
         )
         return {"intent": "transition", "current_role": current_role or "data analyst"}
 
     # Attachment/internship patterns
-    if any(
-        word in text_lower
-        for word in ["attachment", "intern", "internship", "graduate program"]
-    ):
+    if "attachments" in keyword_groups:
         location = extract_location(text)
         return {"intent": "attachments", "location": location}
 
     # Market insights patterns
-    if any(word in text_lower for word in ["market", "trends", "insights", "hiring"]):
+    if "market_insights" in keyword_groups:
         location = extract_location(text)
         return {"intent": "market_insights", "location": location}
 
     # Salary inquiry patterns
-    if any(
-        word in text_lower for word in ["salary", "pay", "compensation", "earnings"]
-    ):
+    if "salary" in keyword_groups:
         role = extract_role_from_salary_query(text)
         location = extract_location(text)
         return {"intent": "salary", "role": role, "location": location}
@@ -114,43 +242,19 @@ def parse_intent(text: str) -> dict:
 
 def extract_location(text: str) -> str | None:
     """Extract location from text"""
-    kenyan_locations = [
-        "nairobi",
-        "mombasa",
-        "kisumu",
-        "nakuru",
-        "eldoret",
-        "thika",
-        "malindi",
-        "kitale",
-        "garissa",
-        "kakamega",
-        "machakos",
-        "meru",
-        "nyeri",
-        "kericho",
-    ]
-
     text_lower = text.lower()
-    for location in kenyan_locations:
-        if location in text_lower:
-            return location.title()
-
-    return None
+    if _LOCATION_FIRST_CHARS.isdisjoint(text_lower):
+        return None
+    match = _LOCATION_RE.search(text_lower)
+    return match.group(1).title() if match else None
 
 
 def extract_role_from_salary_query(text: str) -> str | None:
     """Extract role from salary query"""
     # Look for patterns like "data analyst salary" or "salary for accountant"
-    patterns = [
-        r"(\w+(?:\s+\w+)*)\s+salary",
-        r"salary\s+for\s+(\w+(?:\s+\w+)*)",
-        r"how much do (\w+(?:\s+\w+)*) earn",
-    ]
-
     text_lower = text.lower()
-    for pattern in patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in _SALARY_ROLE_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             return match.group(1).strip()
 
@@ -167,7 +271,8 @@ def format_whatsapp_message(content: str, max_length: int = 1500) -> str:
     return f"{truncated}...\n\n📱 Visit our web app for full details!"
 
 
-@router.post("/webhook")
+# Every reply is a small JSON payload; orjson encodes it faster than stdlib json.
+@router.post("/webhook", response_class=ORJSONResponse)
 async def whatsapp_webhook(request: Request, db: Session = Depends(get_db)):
     form = await request.form()
 
@@ -184,9 +289,10 @@ async def whatsapp_webhook(request: Request, db: Session = Depends(get_db)):
         from twilio.request_validator import RequestValidator
 
         url = settings.TWILIO_WEBHOOK_URL.strip() or str(request.url)
-        params = {k: v for k, v in form.items()}
         validator = RequestValidator(settings.TWILIO_AUTH_TOKEN)
-        if not validator.validate(url, params, signature):
+        # FormData is read in place (via getlist), so no copy is built and
+        # repeated keys are signed exactly as Twilio sent them.
+        if not validator.validate(url, form, signature):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
 
     body = (form.get("Body") or "").strip()
@@ -203,79 +309,93 @@ async def whatsapp_webhook(request: Request, db: Session = Depends(get_db)):
     try:
         if intent == "degree_careers":
             degree = intent_data["degree"]
-            careers = get_careers_for_degree(degree)
+            careers = _careers_for_degree(degree.lower().strip())
 
-            msg = f"🎓 *{degree.title()} Career Paths:*\n\n"
-            for i, career in enumerate(careers[:5], 1):
-                msg += f"{i}. {career.title()}\n"
-
-            msg += f"\n💡 Try: 'search {careers[0]} jobs' for opportunities!"
+            parts = [f"🎓 *{degree.title()} Career Paths:*\n\n"]
+            parts.extend(
+                f"{i}. {career.title()}\n" for i, career in enumerate(careers[:5], 1)
+            )
+            parts.append(f"\n💡 Try: 'search {careers[0]} jobs' for opportunities!")
+            msg = "".join(parts)
 
         elif intent == "transition":
             current_role = intent_data["current_role"]
-            recs = transitions_for(db, current_role)
+            recs = _cached_lookup(
+                ("transitions", current_role.lower().strip()),
+                lambda: transitions_for(db, current_role),
+            )
 
             if not recs:
                 msg = f"🔄 No specific transitions found for '{current_role}'. Try a more common role title."
             else:
-                msg = f"🔄 *Career Transitions from {current_role.title()}:*\n\n"
+                parts = [f"🔄 *Career Transitions from {current_role.title()}:*\n\n"]
                 for i, rec in enumerate(recs[:3], 1):
                     skills_text = (
                         f"Learn: {', '.join(rec['gap_skills'])}"
                         if rec["gap_skills"]
                         else "Good skill match!"
                     )
-                    msg += f"{i}. *{rec['target_role']}* ({rec['overlap']}% match)\n   {skills_text}\n\n"
+                    parts.append(
+                        f"{i}. *{rec['target_role']}* ({rec['overlap']}% match)\n   {skills_text}\n\n"
+                    )
+                msg = "".join(parts)
 
         elif intent == "attachments":
             location = intent_data.get("location")
-            companies = get_attachment_companies(db, location=location)
+            companies = _cached_lookup(
+                ("attachments", location),
+                lambda: get_attachment_companies(db, location=location),
+            )
+            where = f" in {location}" if location else ""
 
             if not companies["companies_with_attachments"]:
-                msg = "🎯 No attachment programs found"
-                if location:
-                    msg += f" in {location}"
-                msg += ". Try broader search or check back later."
+                msg = f"🎯 No attachment programs found{where}. Try broader search or check back later."
             else:
-                msg = "🎯 *Attachment Opportunities"
-                if location:
-                    msg += f" in {location}"
-                msg += ":*\n\n"
-
+                parts = [f"🎯 *Attachment Opportunities{where}:*\n\n"]
                 for i, company in enumerate(
                     companies["companies_with_attachments"][:5], 1
                 ):
-                    msg += f"{i}. *{company['company']}*\n"
-                    msg += f"   {company['sector'] or 'Various sectors'}\n"
-                    msg += f"   {company['attachment_postings']} programs\n\n"
-
-                msg += f"💡 {companies['application_timing']}"
+                    parts.append(
+                        f"{i}. *{company['company']}*\n"
+                        f"   {company['sector'] or 'Various sectors'}\n"
+                        f"   {company['attachment_postings']} programs\n\n"
+                    )
+                parts.append(f"💡 {companies['application_timing']}")
+                msg = "".join(parts)
 
         elif intent == "market_insights":
             location = intent_data.get("location")
-            insights = get_weekly_insights(db, location=location)
+            insights = _cached_lookup(
+                ("insights", location),
+                lambda: get_weekly_insights(db, location=location),
+            )
 
-            msg = "📊 *Market Insights"
+            parts = ["📊 *Market Insights"]
             if location:
-                msg += f" - {location}"
-            msg += ":*\n\n"
+                parts.append(f" - {location}")
+            parts.append(":*\n\n")
 
-            msg += f"📈 {insights['total_postings']} new jobs this week"
+            parts.append(f"📈 {insights['total_postings']} new jobs this week")
             if insights["week_over_week_change"] != 0:
                 change_emoji = "📈" if insights["week_over_week_change"] > 0 else "📉"
-                msg += f" ({change_emoji}{insights['week_over_week_change']:+d})"
-            msg += "\n\n"
+                parts.append(f" ({change_emoji}{insights['week_over_week_change']:+d})")
+            parts.append("\n\n")
 
             if insights["top_hiring_companies"]:
-                msg += "*Top Hiring:*\n"
-                for company in insights["top_hiring_companies"][:3]:
-                    msg += f"• {company['company']} ({company['postings']} jobs)\n"
-                msg += "\n"
+                parts.append("*Top Hiring:*\n")
+                parts.extend(
+                    f"• {company['company']} ({company['postings']} jobs)\n"
+                    for company in insights["top_hiring_companies"][:3]
+                )
+                parts.append("\n")
 
             if insights["trending_skills"]:
-                msg += "*Trending Skills:*\n"
-                for skill in insights["trending_skills"][:3]:
-                    msg += f"• {skill['skill']} (+{skill['growth_rate']}%)\n"
+                parts.append("*Trending Skills:*\n")
+                parts.extend(
+                    f"• {skill['skill']} (+{skill['growth_rate']}%)\n"
+                    for skill in insights["trending_skills"][:3]
+                )
+            msg = "".join(parts)
 
         elif intent == "salary":
             role = intent_data.get("role")
@@ -286,18 +406,24 @@ async def whatsapp_webhook(request: Request, db: Session = Depends(get_db)):
             else:
                 from ..services.recommend import get_salary_insights_for_transition
 
-                salary_data = get_salary_insights_for_transition(db, role)
+                salary_data = _cached_lookup(
+                    ("salary", role.lower().strip()),
+                    lambda: get_salary_insights_for_transition(db, role),
+                )
 
                 if salary_data["sample_size"] == 0:
                     msg = f"💰 Limited salary data for {role.title()}. Try a more common role title."
                 else:
-                    msg = f"💰 *{role.title()} Salary Insights:*\n\n"
+                    parts = [f"💰 *{role.title()} Salary Insights:*\n\n"]
                     if salary_data["median_salary_min"]:
-                        msg += f"Median: KES {salary_data['median_salary_min']:,.0f}"
+                        parts.append(
+                            f"Median: KES {salary_data['median_salary_min']:,.0f}"
+                        )
                         if salary_data["median_salary_max"]:
-                            msg += f" - {salary_data['median_salary_max']:,.0f}"
-                        msg += "\n"
-                    msg += f"\n{salary_data['coverage']}"
+                            parts.append(f" - {salary_data['median_salary_max']:,.0f}")
+                        parts.append("\n")
+                    parts.append(f"\n{salary_data['coverage']}")
+                    msg = "".join(parts)
 
         else:  # Default search
             query = intent_data["query"]
@@ -307,19 +433,19 @@ async def whatsapp_webhook(request: Request, db: Session = Depends(get_db)):
             if not results or (len(results) == 1 and results[0].get("is_suggestion")):
                 msg = "🔍 No matches found. Try:\n• 'I studied [your degree]'\n• 'transition [current role]'\n• 'attachments [location]'"
             else:
-                msg = "🔍 *Job Matches:*\n\n"
+                parts = ["🔍 *Job Matches:*\n\n"]
                 for i, job in enumerate(results[:3], 1):
                     if job.get("is_suggestion"):
                         continue
-                    msg += f"{i}. *{job['title']}*\n"
-                    msg += f"   @ {job['organization']}\n"
+                    parts.append(f"{i}. *{job['title']}*\n   @ {job['organization']}\n")
                     if job.get("location"):
-                        msg += f"   📍 {job['location']}\n"
+                        parts.append(f"   📍 {job['location']}\n")
                     if job.get("why_match"):
-                        msg += f"   ✨ {job['why_match']}\n"
-                    msg += "\n"
+                        parts.append(f"   ✨ {job['why_match']}\n")
+                    parts.append("\n")
 
-                msg += "💡 Reply with company name for more details!"
+                parts.append("💡 Reply with company name for more details!")
+                msg = "".join(parts)
 
     except Exception as e:
         msg = "⚠️ Something went wrong. Please try again or rephrase your question."
@@ -38,6 +38,35 @@ class Celery:
         return
 
 
+class group:
+    """No-op stand-in for `celery.group` so canvas imports resolve."""
+
+    def __init__(self, *tasks, **options):
+        self.tasks = tasks
+        self.options = options
+
+    def apply_async(self, *args, **kwargs):
+        return None
+
+    def __call__(self, *args, **kwargs):
+        return self.apply_async(*args, **kwargs)
+
+
+class _Signal:
+    """No-op stand-in for a celery signal; `connect` returns the handler."""
+
+    def connect(self, func: Callable[..., Any] | None = None, **kwargs):
+        if func is None:
+            return lambda f: f
+        return func
+
+
+class signals:
+    worker_process_init = _Signal()
+    worker_process_shutdown = _Signal()
+    worker_shutdown = _Signal()
+
+
 class _CurrentTask:
     def __init__(self):
         self.request = None
@@ -0,0 +1,45 @@
+import asyncio
+
+from app.services.automated_workflow_service import AutomatedWorkflowService
+
+
+def test_workflow_stages_run_in_order_on_one_session(monkeypatch):
+    # Later stages read rows the earlier ones wrote but have not committed,
+    # so every stage has to share the caller's session.
+    service = AutomatedWorkflowService()
+    main_db = object()
+    calls = []
+
+    def stage(name):
+        async def run(db):
+            assert db is main_db
+            calls.append(name)
+            return {"status": "success"}
+
+        return run
+
+    async def noop_log(db, results):
+        return None
+
+    for name in (
+        "_run_scraper_stage",
+        "_run_processing_stage",
+        "_run_learning_stage",
+        "_run_optimization_stage",
+        "_generate_insights",
+    ):
+        monkeypatch.setattr(service, name, stage(name))
+    monkeypatch.setattr(service, "_log_workflow_completion", noop_log)
+
+    result = asyncio.run(service.run_complete_workflow(main_db))
+
+    assert result["status"] == "success"
+    assert calls == [
+        "_run_scraper_stage",
+        "_run_processing_stage",
+        "_run_learning_stage",
+        "_run_optimization_stage",
+        "_generate_insights",
+    ]
+    assert result["stages"]["optimization"] == {"status": "success"}
+    assert result["stages"]["insights"] == {"status": "success"}
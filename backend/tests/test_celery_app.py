@@ -0,0 +1,61 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from kombu.exceptions import EncodeError
+from kombu.serialization import dumps, loads
+
+from app.core import celery_app  # also registers the orjson serializer
+
+
+def _round_trip(obj):
+    content_type, encoding, body = dumps(obj, serializer="orjson")
+    return loads(body, content_type, encoding)
+
+
+def test_orjson_serializer_round_trips_task_arguments():
+    # Shapes passed by .delay/.s: shard indices, job id batches, alert
+    # frequencies, WhatsApp messages and ProcessingLog event kwargs.
+    args = [
+        [3, 8],
+        [[101, 102, 103]],
+        ["immediate", 0, 4],
+        ["+254700000000", "New jobs: Data Analyst"],
+    ]
+    event = {
+        "process_type": "daily_workflow",
+        "status": "success",
+        "message": None,
+        "details": {
+            "result": {
+                "jobs_processed": 12,
+                "avg_salary": Decimal("85000.50"),
+                "sources": {"brightermonday"},
+                "finished_at": datetime(2026, 1, 2, 3, 4, 5),
+                7: "non-str key",
+            }
+        },
+    }
+
+    assert [_round_trip(a) for a in args] == args
+    assert _round_trip(event)["details"]["result"] == {
+        "jobs_processed": 12,
+        "avg_salary": 85000.5,
+        "sources": ["brightermonday"],
+        "finished_at": "2026-01-02T03:04:05",
+        "7": "non-str key",
+    }
+
+
+def test_orjson_serializer_rejects_unsupported_types():
+    with pytest.raises(EncodeError):
+        dumps({"db": object()}, serializer="orjson")
+
+
+def test_government_post_batches_route_to_processing_queue():
+    routes = celery_app.celery_app.conf["task_routes"]
+
+    assert routes["app.tasks.gov_monitor_tasks.process_government_posts_batch"] == {
+        "queue": "processing"
+    }
+    assert routes["app.tasks.gov_monitor_tasks.*"] == {"queue": "scrapers"}
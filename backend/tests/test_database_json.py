@@ -0,0 +1,42 @@
+from decimal import Decimal
+
+import numpy as np
+from sqlalchemy import JSON, Column, Integer, MetaData, Table, create_engine, select
+
+from app.db import database
+
+
+def test_engine_json_columns_accept_numpy_decimal_and_wide_ints():
+    engine = create_engine("sqlite://", **database._JSON_ENGINE_KWARGS)
+    table = Table(
+        "payloads",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("data", JSON),
+    )
+    table.metadata.create_all(engine)
+    payloads = [
+        {
+            "score": np.float32(0.5),
+            "count": np.int64(3),
+            "vector": np.array([1.0, 2.0]),
+            "salary": Decimal("1250.50"),
+            7: "non-str key",
+        },
+        {"big": 2**70, "count": np.int64(4), "salary": Decimal("2")},
+    ]
+
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [{"data": p} for p in payloads])
+        rows = conn.execute(select(table.c.data).order_by(table.c.id)).scalars()
+        assert list(rows) == [
+            {
+                "score": 0.5,
+                "count": 3,
+                "vector": [1.0, 2.0],
+                "salary": 1250.5,
+                "7": "non-str key",
+            },
+            {"big": 2**70, "count": 4, "salary": 2.0},
+        ]
+    engine.dispose()
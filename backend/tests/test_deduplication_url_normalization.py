@@ -12,3 +12,13 @@ def test_generate_url_hash_is_stable_for_www_variants():
     a = "https://example.com/jobs/role?id=123&utm_medium=y"
     b = "https://www.example.com/jobs/role?id=123"
     assert svc.generate_url_hash(a) == svc.generate_url_hash(b)
+
+
+def test_content_hash_ignores_case_and_whitespace():
+    from app.normalization.dedupe import content_hash
+
+    a = content_hash("Data  Analyst", "Analyse sales\n data.")
+    b = content_hash("data analyst", "analyse sales data.")
+    assert a == b
+    assert content_hash("Data Analyst", "Different text") != a
+    assert content_hash(None, "   ") is None
@@ -0,0 +1,97 @@
+from datetime import datetime
+
+import pytest
+
+from app.db.models import JobPost
+from app.tasks import gov_monitor_tasks
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = str(value)
+
+
+@pytest.fixture()
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(gov_monitor_tasks, "get_redis_client", lambda: fake)
+    return fake
+
+
+def _add_gov_jobs(db, count):
+    for i in range(count):
+        db.add(
+            JobPost(
+                source=gov_monitor_tasks.GOV_SOURCE,
+                url=f"https://example.go.ke/jobs/{i}",
+                url_hash=f"gov-{i}",
+                title_raw="Clerk",
+                first_seen=datetime.utcnow(),
+            )
+        )
+    db.commit()
+    return [job.id for job in db.query(JobPost).order_by(JobPost.id)]
+
+
+def _mark_processed(db, ids):
+    for job in db.query(JobPost).filter(JobPost.id.in_(ids)):
+        job.processed_at = datetime.utcnow()
+    db.commit()
+
+
+def test_cursor_stays_below_rows_from_unfinished_batches(db_session_factory, redis):
+    db = db_session_factory()
+    ids = _add_gov_jobs(db, 6)
+
+    # The later batch finishes first: the earlier one is still pending.
+    _mark_processed(db, ids[3:])
+    gov_monitor_tasks._advance_process_cursor(db, ids[3:])
+    assert gov_monitor_tasks._read_process_cursor() == 0
+
+    _mark_processed(db, ids[:3])
+    gov_monitor_tasks._advance_process_cursor(db, ids[:3])
+    assert gov_monitor_tasks._read_process_cursor() == ids[2]
+    db.close()
+
+
+def test_rows_from_a_failed_batch_are_rescanned(db_session_factory, redis, monkeypatch):
+    db = db_session_factory()
+    ids = _add_gov_jobs(db, 6)
+    dispatched = []
+
+    monkeypatch.setattr(gov_monitor_tasks, "SessionLocal", db_session_factory)
+    monkeypatch.setattr(gov_monitor_tasks, "run_government_sources", lambda db: 0)
+    monkeypatch.setattr(gov_monitor_tasks, "POST_PROCESS_BATCH_SIZE", 3)
+
+    class FakeGroup:
+        def __init__(self, signatures):
+            list(signatures)
+
+        def apply_async(self):
+            pass
+
+    monkeypatch.setattr(gov_monitor_tasks, "group", FakeGroup)
+    monkeypatch.setattr(
+        gov_monitor_tasks.process_government_posts_batch,
+        "s",
+        lambda batch: dispatched.append(batch),
+        raising=False,
+    )
+
+    gov_monitor_tasks._run_government_sources_sync()
+    assert dispatched == [ids[:3], ids[3:]]
+
+    # First batch is lost; the second commits and advances the cursor.
+    _mark_processed(db, ids[3:])
+    gov_monitor_tasks._advance_process_cursor(db, ids[3:])
+
+    dispatched.clear()
+    gov_monitor_tasks._run_government_sources_sync()
+    assert dispatched == [ids[:3]]
+    db.close()
@@ -193,3 +193,19 @@ class TestIncrementalEmbeddings:
         result = run_incremental_embeddings(db)
         assert result["processed"] == 0
         db.close()
+
+    def test_stored_vectors_are_rounded(self, db_session_factory):
+        db = db_session_factory()
+        _add_job(db, 1, "Backend engineer working with Postgres")
+        db.commit()
+
+        run_incremental_embeddings(db)
+
+        emb = db.query(JobEmbedding).one()
+        vec = (
+            json.loads(emb.vector_json)
+            if isinstance(emb.vector_json, str)
+            else emb.vector_json
+        )
+        assert all(round(v, 4) == v for v in vec)
+        db.close()
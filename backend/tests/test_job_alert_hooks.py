@@ -74,3 +74,53 @@ def test_job_alert_hooks_send_email_and_whatsapp(db_session_factory, monkeypatch
     assert notification.delivery_status.get("email") == "sent"
     assert notification.delivery_status.get("whatsapp") == "sent"
     db.close()
+
+
+def test_job_alert_shards_partition_alerts_by_id(db_session_factory, monkeypatch):
+    db = db_session_factory()
+    user = User(
+        uuid="shard-user-uuid",
+        email="shard@test.local",
+        hashed_password="not-used",
+        full_name="Shard User",
+        is_active=True,
+        is_verified=True,
+    )
+    db.add(user)
+    db.flush()
+    alerts = [
+        JobAlert(
+            user_id=user.id,
+            name=f"Alert {i}",
+            query="backend",
+            frequency="daily",
+            delivery_methods=[],
+            is_active=True,
+        )
+        for i in range(4)
+    ]
+    db.add_all(alerts)
+    db.commit()
+    alert_ids = [a.id for a in alerts]
+
+    searched = []
+
+    def fake_search_jobs(*_args, **_kwargs):
+        searched.append(_kwargs.get("q"))
+        return []
+
+    monkeypatch.setattr("app.services.search.search_jobs", fake_search_jobs)
+    monkeypatch.setattr(
+        "app.tasks.processing_tasks.SessionLocal",
+        db_session_factory,
+    )
+
+    processed = [
+        _process_job_alerts_sync("daily", shard, 2)["alerts_processed"]
+        for shard in range(2)
+    ]
+    assert processed == [
+        sum(1 for i in alert_ids if i % 2 == shard) for shard in range(2)
+    ]
+    assert len(searched) == len(alert_ids)
+    db.close()
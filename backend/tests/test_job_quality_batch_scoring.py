@@ -0,0 +1,43 @@
+import asyncio
+
+import numpy as np
+
+from app.services.automated_workflow_service import automated_workflow_service
+
+
+def test_batch_quality_scores_match_per_job_scorer():
+    jobs = [
+        {
+            "title": "Data Analyst",
+            "description": "x" * 1200,
+            "requirements": "y" * 250,
+            "company": "Acme",
+            "location": "Nairobi",
+            "salary_min": 50000,
+            "salary_max": None,
+        },
+        {
+            "title": "Clerk",
+            "description": "x" * 300,
+            "requirements": "",
+            "company": None,
+            "location": None,
+            "salary_min": 0,
+            "salary_max": 0,
+        },
+    ]
+
+    expected = [
+        asyncio.run(automated_workflow_service._calculate_job_quality_score(job))
+        for job in jobs
+    ]
+    scores = automated_workflow_service._calculate_job_quality_scores_batch(
+        np.array([len(j["title"]) for j in jobs]),
+        np.array([len(j["description"]) for j in jobs]),
+        np.array([len(j["requirements"]) for j in jobs]),
+        np.array([bool(j["company"]) for j in jobs]),
+        np.array([bool(j["location"]) for j in jobs]),
+        np.array([bool(j["salary_min"] or j["salary_max"]) for j in jobs]),
+    )
+
+    assert scores.tolist() == expected
@@ -0,0 +1,62 @@
+import pytest
+
+from app.core import locks
+
+
+def test_skip_if_running_skips_while_lock_is_held(monkeypatch):
+    class FakeRedis:
+        def __init__(self):
+            self.store = {}
+
+        def set(self, key, value, nx=False, px=None):
+            if nx and key in self.store:
+                return None
+            self.store[key] = value
+            return True
+
+    fake_redis = FakeRedis()
+    monkeypatch.setattr(locks, "get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(
+        locks,
+        "_get_release_script",
+        lambda: lambda keys, args: fake_redis.store.pop(keys[0], None),
+    )
+
+    nested = []
+
+    @locks.skip_if_running("test:lock", ttl_seconds=60)
+    def task(value):
+        if value == "outer":
+            nested.append(task("inner"))
+        return {"status": "completed", "value": value}
+
+    assert task("outer") == {"status": "completed", "value": "outer"}
+    assert nested == [{"status": "skipped", "reason": "lock_not_acquired:test:lock"}]
+    assert fake_redis.store == {}
+    assert task("again")["status"] == "completed"
+
+
+def test_skip_if_running_propagates_task_errors_and_releases(monkeypatch):
+    store = {}
+
+    class FakeRedis:
+        def set(self, key, value, nx=False, px=None):
+            if nx and key in store:
+                return None
+            store[key] = value
+            return True
+
+    monkeypatch.setattr(locks, "get_redis_client", lambda: FakeRedis())
+    monkeypatch.setattr(
+        locks,
+        "_get_release_script",
+        lambda: lambda keys, args: store.pop(keys[0], None),
+    )
+
+    @locks.skip_if_running("test:lock", ttl_seconds=60)
+    def task():
+        raise ConnectionError("scraper site unreachable")
+
+    with pytest.raises(ConnectionError, match="scraper site unreachable"):
+        task()
+    assert store == {}
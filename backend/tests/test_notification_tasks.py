@@ -0,0 +1,49 @@
+import asyncio
+import threading
+
+from app.tasks import notification_tasks
+
+
+def test_queue_whatsapp_message_dispatches_to_worker(monkeypatch):
+    queued = []
+
+    def fail_send(*_args):
+        raise AssertionError("message should not be sent inline")
+
+    monkeypatch.setattr(
+        notification_tasks.send_whatsapp_message_task,
+        "delay",
+        lambda *args: queued.append(args),
+        raising=False,
+    )
+    monkeypatch.setattr(notification_tasks, "send_whatsapp_message_sync", fail_send)
+
+    asyncio.run(notification_tasks.queue_whatsapp_message("+254700000000", "New job"))
+
+    assert queued == [("+254700000000", "New job")]
+
+
+def test_queue_whatsapp_message_sends_off_the_loop_when_queueing_fails(monkeypatch):
+    sent = []
+
+    def broken_delay(*_args):
+        raise ConnectionError("broker down")
+
+    def fake_send(to_number, message):
+        sent.append((to_number, message, threading.current_thread()))
+        return True
+
+    monkeypatch.setattr(
+        notification_tasks.send_whatsapp_message_task,
+        "delay",
+        broken_delay,
+        raising=False,
+    )
+    monkeypatch.setattr(notification_tasks, "send_whatsapp_message_sync", fake_send)
+
+    asyncio.run(notification_tasks.queue_whatsapp_message("+254700000000", "New job"))
+
+    ((to_number, message, thread),) = sent
+    assert (to_number, message) == ("+254700000000", "New job")
+    # The blocking Twilio call must not run on the event loop's thread.
+    assert thread is not threading.current_thread()
@@ -0,0 +1,325 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy import UniqueConstraint
+
+from app.db.database import _HybridSession
+from app.db.models import JobPost, JobSkill, Skill
+from app.tasks import processing_tasks
+
+
+@pytest.fixture()
+def task_db(monkeypatch, db_session_factory):
+    """Point the task helpers at the test database and reset skill caches."""
+
+    @asynccontextmanager
+    async def fake_scope():
+        session = db_session_factory()
+        try:
+            yield _HybridSession(session)
+        finally:
+            session.close()
+
+    monkeypatch.setattr(processing_tasks, "session_scope", fake_scope)
+    monkeypatch.setattr(processing_tasks, "_skill_id_cache", {})
+    monkeypatch.setattr(processing_tasks, "_skill_id_cache_loaded", False)
+    return db_session_factory
+
+
+@pytest.fixture()
+def legacy_task_db(monkeypatch, request):
+    """Like ``task_db``, but job_post.url is not unique (older schemas)."""
+    table = JobPost.__table__
+    monkeypatch.setattr(
+        table,
+        "constraints",
+        {
+            c
+            for c in table.constraints
+            if not (isinstance(c, UniqueConstraint) and "url" in c.columns)
+        },
+    )
+    return request.getfixturevalue("task_db")
+
+
+def _add_jobs(session_factory, *titles):
+    db = session_factory()
+    for i, title in enumerate(titles):
+        db.add(
+            JobPost(
+                source="test",
+                url=f"https://example.com/jobs/{i}",
+                url_hash=f"job-{i}",
+                title_raw=title,
+                description_raw="Python and SQL",
+                first_seen=datetime.utcnow(),
+            )
+        )
+    db.commit()
+    ids = [job.id for job in db.query(JobPost).order_by(JobPost.id)]
+    db.close()
+    return ids
+
+
+def test_extract_job_skills_rerun_does_not_duplicate_rows(monkeypatch, task_db):
+    monkeypatch.setattr(
+        processing_tasks,
+        "_extract_skills_cached",
+        lambda text: {"python": 0.9, "sql": 0.8},
+    )
+    (job_id,) = _add_jobs(task_db, "Data Analyst")
+
+    results = [
+        asyncio.run(processing_tasks._extract_job_skills_async([job_id]))
+        for _ in range(3)
+    ]
+
+    assert [r["skills_extracted"] for r in results] == [2, 0, 0]
+    db = task_db()
+    assert db.query(JobSkill).filter(JobSkill.job_post_id == job_id).count() == 2
+    assert {s.name for s in db.query(Skill)} == {"python", "sql"}
+    db.close()
+
+
+def test_validate_job_data_counts_match_reported_issues(monkeypatch, task_db):
+    monkeypatch.setattr(processing_tasks, "SessionLocal", task_db)
+    db = task_db()
+    db.add_all(
+        [
+            JobPost(
+                source="test",
+                url="https://example.com/ok",
+                url_hash="ok",
+                title_raw="Data Analyst",
+                description_raw="x" * 60,
+                first_seen=datetime.utcnow(),
+            ),
+            JobPost(
+                source="test",
+                url="ftp://example.com/bad",
+                url_hash="bad",
+                title_raw="QA",
+                description_raw="short",
+                salary_min=90000,
+                salary_max=50000,
+                first_seen=datetime.utcnow(),
+            ),
+        ]
+    )
+    db.commit()
+    db.close()
+
+    results = processing_tasks._validate_job_data_sync()["validation_results"]
+
+    assert results["total_jobs"] == 2
+    assert results["invalid_jobs"] == 1
+    (issue,) = results["validation_issues"]
+    assert sorted(issue["issues"]) == sorted(results["issue_counts"])
+    assert set(results["issue_counts"].values()) == {1}
+
+
+def test_update_job_column_writes_each_row_and_reruns_cleanly(monkeypatch, task_db):
+    monkeypatch.setattr(processing_tasks, "WRITE_CHUNK_SIZE", 2)
+    ids = _add_jobs(task_db, "A", "B", "C")
+    pairs = [(job_id, 0.5 + i / 10) for i, job_id in enumerate(ids)]
+
+    async def run():
+        async with processing_tasks.session_scope() as db:
+            return await processing_tasks._update_job_column(
+                db, "quality_score", pairs, "quality score"
+            )
+
+    assert asyncio.run(run()) == 3
+    assert asyncio.run(run()) == 3
+
+    db = task_db()
+    assert [j.quality_score for j in db.query(JobPost).order_by(JobPost.id)] == [
+        0.5,
+        0.6,
+        0.7,
+    ]
+    db.close()
+
+
+def test_update_job_column_casts_values_on_postgres(monkeypatch):
+    from sqlalchemy.dialects import postgresql
+
+    built = []
+
+    async def capture(db, stmt, rows, label):
+        built.append(stmt(rows))
+        return len(rows)
+
+    monkeypatch.setattr(processing_tasks, "_write_in_chunks", capture)
+    fake_db = type(
+        "FakeDb",
+        (),
+        {"bind": type("Bind", (), {"dialect": postgresql.dialect()})()},
+    )()
+
+    written = asyncio.run(
+        processing_tasks._update_job_column(
+            fake_db, "title_norm_id", [(1, None), (2, None)], "title norm"
+        )
+    )
+
+    sql = str(built[0].compile(dialect=postgresql.dialect()))
+    assert written == 2
+    assert "FROM (VALUES" in sql
+    assert "title_norm_id=CAST(v.value AS INTEGER)" in sql
+
+
+def test_extract_job_skills_resolves_skills_in_bulk(monkeypatch, task_db):
+    db = task_db()
+    db.add(Skill(name="python", aliases={}))
+    db.commit()
+    (python_id,) = [s.id for s in db.query(Skill)]
+    db.close()
+    monkeypatch.setattr(
+        processing_tasks,
+        "_extract_skills_cached",
+        lambda text: {"python": 0.9, "excel": 0.8, "typing": 0.2},
+    )
+    ids = _add_jobs(task_db, "Analyst", "Engineer")
+
+    result = asyncio.run(processing_tasks._extract_job_skills_async())
+
+    assert result == {
+        "status": "completed",
+        "jobs_processed": 2,
+        "skills_extracted": 4,
+    }
+    db = task_db()
+    skills = {s.name: s.id for s in db.query(Skill)}
+    assert set(skills) == {"python", "excel"}  # low confidence skipped
+    assert skills["python"] == python_id
+    for job_id in ids:
+        assert {
+            js.skill_id for js in db.query(JobSkill).filter_by(job_post_id=job_id)
+        } == set(skills.values())
+    db.close()
+
+
+def test_normalize_job_titles_reuses_title_norms_in_bulk(monkeypatch, task_db):
+    from app.db.models import TitleNorm
+
+    db = task_db()
+    db.add(TitleNorm(family="data", canonical_title="data analyst", aliases={}))
+    db.commit()
+    db.close()
+    calls = []
+
+    def fake_normalize(raw):
+        calls.append(raw)
+        if "analyst" in raw:
+            return ("data", "data analyst")
+        return ("engineering", "software engineer")
+
+    monkeypatch.setattr(processing_tasks, "_normalize_title_cached", fake_normalize)
+    ids = _add_jobs(task_db, "Data Analyst", " data analyst ", "Software Engineer")
+
+    first = asyncio.run(processing_tasks._normalize_job_titles_async())
+    second = asyncio.run(processing_tasks._normalize_job_titles_async())
+
+    assert first == {"status": "completed", "jobs_normalized": 3}
+    assert second == {"status": "completed", "jobs_normalized": 0}
+    assert sorted(calls) == ["data analyst", "software engineer"]
+    db = task_db()
+    norms = {t.canonical_title: t.id for t in db.query(TitleNorm)}
+    assert len(norms) == 2
+    jobs = {j.id: j.title_norm_id for j in db.query(JobPost)}
+    assert jobs == {
+        ids[0]: norms["data analyst"],
+        ids[1]: norms["data analyst"],
+        ids[2]: norms["software engineer"],
+    }
+    db.close()
+
+
+def test_clean_duplicate_jobs_deactivates_instead_of_deleting(legacy_task_db):
+    db = legacy_task_db()
+    db.add(Skill(name="python", aliases={}))
+    for i, (url, title, description) in enumerate(
+        [
+            ("https://example.com/a", "Analyst", "Python and SQL"),
+            ("https://example.com/a", "Analyst", "Python, SQL and Excel"),
+            ("https://example.com/b", "Engineer", "Go"),
+            ("https://example.com/c", "Engineer", "Go"),
+        ]
+    ):
+        db.add(
+            JobPost(
+                source="test",
+                url=url,
+                url_hash=f"job-{i}",
+                title_raw=title,
+                description_raw=description,
+                first_seen=datetime.utcnow(),
+            )
+        )
+    db.commit()
+    ids = [job.id for job in db.query(JobPost).order_by(JobPost.id)]
+    (skill_id,) = [s.id for s in db.query(Skill)]
+    db.add_all([JobSkill(job_post_id=job_id, skill_id=skill_id) for job_id in ids])
+    db.commit()
+    db.close()
+
+    result = asyncio.run(processing_tasks._clean_duplicate_jobs_async())
+
+    assert result["url_duplicates_deactivated"] == 1
+    assert result["content_duplicates_deactivated"] == 1
+    db = legacy_task_db()
+    active = {j.id: j.is_active for j in db.query(JobPost)}
+    assert active == {ids[0]: True, ids[1]: False, ids[2]: True, ids[3]: False}
+    assert db.query(JobSkill).count() == 4
+    db.close()
+
+
+def test_clean_duplicate_jobs_shards_cover_each_url_group_once(legacy_task_db):
+    db = legacy_task_db()
+    urls = [f"https://example.com/{'x' * n}" for n in range(1, 7)]
+    for i, url in enumerate(urls * 2):
+        db.add(
+            JobPost(
+                source="test",
+                url=url,
+                url_hash=f"job-{i}",
+                title_raw="Analyst",
+                description_raw=f"Posting {i}",
+                first_seen=datetime.utcnow(),
+            )
+        )
+    db.commit()
+    db.close()
+
+    results = [
+        asyncio.run(processing_tasks._clean_duplicate_jobs_async(i, 3))
+        for i in range(3)
+    ]
+
+    assert [r["url_duplicates_deactivated"] for r in results] == [2, 2, 2]
+    db = legacy_task_db()
+    active = [j.url for j in db.query(JobPost).filter(JobPost.is_active.is_(True))]
+    assert sorted(active) == sorted(urls)
+    db.close()
+
+
+def test_process_raw_jobs_reports_progress_against_jobs_found(monkeypatch, task_db):
+    class FakeProcessor:
+        async def process_job(self, job):
+            return None
+
+    monkeypatch.setattr(processing_tasks, "_get_job_processor", FakeProcessor)
+    _add_jobs(task_db, "A", "B", "C")
+    progress = []
+
+    result = asyncio.run(
+        processing_tasks._process_raw_jobs_async(
+            100, lambda done, total: progress.append((done, total))
+        )
+    )
+
+    assert result["processed_jobs"] == 3
+    assert progress == [(1, 3), (2, 3), (3, 3)]
@@ -0,0 +1,257 @@
+import asyncio
+
+from app.tasks import scraper_tasks
+
+
+def _patch_sites(monkeypatch, sites, run_site):
+    async def fake_configs():
+        return {name: {} for name in sites}
+
+    monkeypatch.setattr(
+        scraper_tasks.automated_workflow_service,
+        "_get_scraper_configs",
+        fake_configs,
+    )
+    monkeypatch.setattr(scraper_tasks.scraper_service, "run_scraper_for_site", run_site)
+
+
+def test_run_all_scrapers_runs_sites_concurrently(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_run(site_name, timeout=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if site_name == "broken":
+            raise RuntimeError("site down")
+        return {"jobs_scraped": 2}
+
+    _patch_sites(monkeypatch, ["a", "b", "broken"], fake_run)
+    progress = []
+
+    result = asyncio.run(
+        scraper_tasks._run_all_scrapers_async(
+            lambda done, total: progress.append((done, total))
+        )
+    )
+
+    assert peak == 3
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert result["total_jobs_scraped"] == 4
+    assert result["site_results"]["a"] == {"jobs_scraped": 2}
+    assert result["site_results"]["broken"] == {
+        "status": "failed",
+        "error": "site down",
+    }
+
+
+def test_run_all_scrapers_caps_concurrency(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_run(site_name, timeout=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"jobs_scraped": 1}
+
+    _patch_sites(monkeypatch, [f"site{i}" for i in range(6)], fake_run)
+    monkeypatch.setattr(scraper_tasks, "SCRAPER_MAX_CONCURRENCY", 2)
+
+    result = asyncio.run(scraper_tasks._run_all_scrapers_async())
+
+    assert peak == 2
+    assert result["total_jobs_scraped"] == 6
+
+
+def test_report_progress_is_opt_in(monkeypatch):
+    from app.core.config import settings
+    from app.tasks.progress import report_progress
+
+    class FakeTask:
+        def __init__(self):
+            self.states = []
+
+        def update_state(self, state, meta):
+            self.states.append((state, meta))
+
+    task = FakeTask()
+    monkeypatch.setattr(settings, "CELERY_TRACK_PROGRESS", False)
+    report_progress(task, "Starting")
+    assert task.states == []
+
+    monkeypatch.setattr(settings, "CELERY_TRACK_PROGRESS", True)
+    report_progress(task, "Starting")
+    assert task.states == [("PROGRESS", {"status": "Starting", "progress": 0})]
+
+
+def test_validate_scraper_config_reuses_cached_result(monkeypatch):
+    class FakeRedis:
+        def __init__(self):
+            self.store = {}
+
+        def get(self, key):
+            return self.store.get(key)
+
+        def setex(self, key, ttl, value):
+            self.store[key] = value
+
+    calls = []
+
+    async def fake_test_scraper(site_name, config, client=None):
+        calls.append(site_name)
+        return {"site_name": site_name, "status": "success"}
+
+    fake_redis = FakeRedis()
+    monkeypatch.setattr(scraper_tasks, "get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(
+        scraper_tasks.automated_workflow_service, "_test_scraper", fake_test_scraper
+    )
+    config = {"base_url": "https://x", "listing_path": "/", "listing_selector": "a"}
+
+    first = scraper_tasks.validate_scraper_config(None, "site", config)
+    second = scraper_tasks.validate_scraper_config(None, "site", config)
+    scraper_tasks.validate_scraper_config(None, "site", {**config, "base_url": "y"})
+
+    assert first == second
+    assert first["config_valid"] is True
+    assert calls == ["site", "site"]
+
+
+def test_cleanup_old_jobs_deletes_in_batches(monkeypatch, db_session_factory):
+    from contextlib import asynccontextmanager
+    from datetime import datetime, timedelta
+
+    from app.db.database import _HybridSession
+    from app.db.models import JobPost
+
+    db = db_session_factory()
+    old = datetime.utcnow() - timedelta(days=90)
+    for i in range(5):
+        db.add(
+            JobPost(
+                source="test",
+                url=f"https://example.com/old/{i}",
+                url_hash=f"old-{i}",
+                title_raw="Old job",
+                first_seen=old,
+            )
+        )
+    db.add(
+        JobPost(
+            source="test",
+            url="https://example.com/new",
+            url_hash="new",
+            title_raw="New job",
+            first_seen=datetime.utcnow(),
+        )
+    )
+    db.commit()
+
+    executed = []
+
+    @asynccontextmanager
+    async def fake_scope():
+        session = db_session_factory()
+        original_execute = session.execute
+
+        def counting_execute(*args, **kwargs):
+            executed.append(args[0])
+            return original_execute(*args, **kwargs)
+
+        session.execute = counting_execute
+        try:
+            yield _HybridSession(session)
+        finally:
+            session.close()
+
+    monkeypatch.setattr(scraper_tasks, "session_scope", fake_scope)
+    monkeypatch.setattr(scraper_tasks, "CLEANUP_DELETE_BATCH_SIZE", 2)
+
+    result = asyncio.run(scraper_tasks._cleanup_old_jobs_async(30))
+
+    assert result["deleted_jobs"] == 5
+    assert len(executed) == 3  # 2 + 2 + 1
+    assert [j.url_hash for j in db.query(JobPost).all()] == ["new"]
+    db.close()
+
+
+def test_run_all_scrapers_times_out_hung_sites(monkeypatch):
+    timeouts = []
+
+    async def fake_run(site_name, timeout=None):
+        timeouts.append(timeout)
+        if site_name == "hung":
+            await asyncio.sleep(10)
+        return {"jobs_scraped": 1}
+
+    _patch_sites(monkeypatch, ["hung", "ok"], fake_run)
+    monkeypatch.setattr(scraper_tasks, "SCRAPER_SITE_TIMEOUT", 0.05)
+
+    result = asyncio.run(scraper_tasks._run_all_scrapers_async())
+
+    assert result["site_results"]["hung"] == {"status": "timed_out_still_running"}
+    assert result["total_jobs_scraped"] == 1
+    # The spider gets the same ceiling as a crawl deadline.
+    assert timeouts == [0.05, 0.05]
+
+
+def test_timed_out_scrape_keeps_its_concurrency_slot(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_run(site_name, timeout=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Outlives its timeout, like an executor thread that cannot be
+        # cancelled.
+        await asyncio.sleep(0.2)
+        in_flight -= 1
+        return {"jobs_scraped": 1}
+
+    _patch_sites(monkeypatch, ["slow-a", "slow-b"], fake_run)
+    monkeypatch.setattr(scraper_tasks, "SCRAPER_SITE_TIMEOUT", 0.05)
+    monkeypatch.setattr(scraper_tasks, "SCRAPER_MAX_CONCURRENCY", 1)
+
+    result = asyncio.run(scraper_tasks._run_all_scrapers_async())
+
+    assert peak == 1
+    assert {r["status"] for r in result["site_results"].values()} == {
+        "timed_out_still_running"
+    }
+
+
+def test_probe_clients_are_per_loop_and_closed_on_shutdown():
+    import threading
+
+    from app.tasks.worker_loop import run_in_worker_loop
+
+    async def client_pair():
+        return scraper_tasks._get_http_client(), scraper_tasks._get_http_client()
+
+    clients = []
+    threads = [
+        threading.Thread(
+            target=lambda: clients.append(run_in_worker_loop(client_pair()))
+        )
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    (a1, a2), (b1, b2) = clients
+    assert a1 is a2 and b1 is b2  # reused within a loop
+    assert a1 is not b1  # never shared across loops
+
+    scraper_tasks._close_http_clients()
+
+    assert a1.is_closed and b1.is_closed
+    assert len(scraper_tasks._http_clients) == 0
@@ -130,3 +130,32 @@ def test_search_jobs_prioritizes_cleaner_sources_and_exposes_quality_fields(
     assert noisy_result["source_quality_score"] == get_source_quality_score(
         "telegram:jobs"
     )
+
+
+def test_search_jobs_min_first_seen_excludes_older_jobs(db_session_factory):
+    db = db_session_factory()
+    old_seen = datetime(2026, 4, 1, 12, 0, 0)
+    new_seen = datetime(2026, 4, 8, 12, 0, 0)
+    for idx, seen_at in enumerate([old_seen, new_seen]):
+        db.add(
+            JobPost(
+                source="greenhouse",
+                url=f"https://example.com/jobs/cutoff-{idx}",
+                url_hash=f"cutoff-{idx}",
+                title_raw="Data Analyst",
+                description_raw="Python SQL dashboards reporting " * 20,
+                first_seen=seen_at,
+                last_seen=seen_at,
+                is_active=True,
+            )
+        )
+    db.commit()
+
+    result = search_jobs(db, q="data analyst", min_first_seen=datetime(2026, 4, 5))
+    assert [job["url"] for job in result["jobs"]] == [
+        "https://example.com/jobs/cutoff-1"
+    ]
+
+    empty = search_jobs(db, q="data analyst", min_first_seen=datetime(2026, 4, 9))
+    assert empty["jobs"] == []
+    db.close()
@@ -124,3 +124,54 @@ def test_subscription_activate_upgrades_user_tier(db_session_factory):
     assert user.subscription_expires is not None
     assert user.subscription_expires > datetime.utcnow()
     db.close()
+
+
+def test_activate_plans_bulk_upgrades_users_in_one_commit(db_session_factory):
+    from app.db.models import UserNotification
+    from app.services.subscription_service import subscription_service
+
+    db = db_session_factory()
+    users = [
+        User(
+            uuid=f"bulk-user-{idx}",
+            email=f"bulk.{idx}@example.com",
+            hashed_password="not-used",
+            full_name=f"Bulk User {idx}",
+            subscription_tier="basic",
+            is_active=True,
+            is_verified=True,
+        )
+        for idx in range(2)
+    ]
+    db.add_all(users)
+    db.commit()
+    user_ids = [user.id for user in users]
+
+    results = subscription_service.activate_plans_bulk(
+        db,
+        [
+            (user_ids[0], "professional_monthly"),
+            (user_ids[1], "enterprise_monthly"),
+        ],
+    )
+
+    assert [r["subscription_tier"] for r in results] == [
+        "professional",
+        "enterprise",
+    ]
+    tiers = dict(
+        db.execute(
+            select(User.id, User.subscription_tier).where(User.id.in_(user_ids))
+        ).all()
+    )
+    assert tiers == {user_ids[0]: "professional", user_ids[1]: "enterprise"}
+    notifications = (
+        db.execute(
+            select(UserNotification).where(UserNotification.user_id.in_(user_ids))
+        )
+        .scalars()
+        .all()
+    )
+    assert len(notifications) == 2
+    assert all(n.type == "subscription_upgrade" for n in notifications)
+    db.close()
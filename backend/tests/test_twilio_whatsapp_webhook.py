@@ -1,3 +1,4 @@
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -83,3 +84,128 @@ def test_twilio_webhook_allows_unsigned_when_disabled(db_session_factory, monkey
     with TestClient(app) as client:
         resp = client.post("/whatsapp/webhook", data={"Body": ""})
         assert resp.status_code == 200, resp.text
+
+
+def test_extract_location_matches_whole_town_names():
+    from app.webhooks.whatsapp import extract_location
+
+    assert extract_location("Data jobs in NAIROBI") == "Nairobi"
+    assert extract_location("Nakuru-based attachments") == "Nakuru"
+    assert extract_location("homeruns and more") is None
+    assert extract_location("salary") is None
+    assert extract_location("hi") is None
+    assert extract_location("MOMBASA") == "Mombasa"
+
+
+def test_parse_intent_keeps_intent_precedence():
+    from app.webhooks.whatsapp import parse_intent
+
+    assert parse_intent("salary and market trends")["intent"] == "market_insights"
+    assert parse_intent("pay for an internship")["intent"] == "attachments"
+    assert parse_intent("hiring transition analyst")["intent"] == "transition"
+    assert parse_intent("accountant salary Nairobi") == {
+        "intent": "salary",
+        "role": "accountant",
+        "location": "Nairobi",
+    }
+
+
+def test_parse_intent_keeps_non_ascii_words_whole():
+    from app.webhooks.whatsapp import extract_role_from_salary_query, parse_intent
+
+    assert parse_intent("degree in café management")["degree"] == "café management"
+    assert parse_intent("I studied économie") == {
+        "intent": "degree_careers",
+        "degree": "économie",
+    }
+    assert parse_intent("Kiswahili na fasihi graduate")["degree"] == (
+        "kiswahili na fasihi"
+    )
+    assert extract_role_from_salary_query("salary for Ngũgĩ role") == "ngũgĩ role"
+    assert extract_role_from_salary_query("mpishi\u00a0salary") == "mpishi"
+
+
+def test_re2_word_classes_match_stdlib_re():
+    import re
+
+    import app.webhooks.whatsapp as whatsapp
+
+    if whatsapp.re2 is None:
+        pytest.skip("google-re2 not installed")
+
+    word = whatsapp.re2.compile(whatsapp._WORD)
+    space = whatsapp.re2.compile(whatsapp._SPACE)
+    for cp in range(0x3000):
+        char = chr(cp)
+        assert bool(word.fullmatch(char)) == bool(re.fullmatch(r"\w", char)), hex(cp)
+        assert bool(space.fullmatch(char)) == bool(re.fullmatch(r"\s", char)), hex(cp)
+
+
+def test_parse_intent_caches_per_body_and_returns_fresh_dicts():
+    import app.webhooks.whatsapp as whatsapp
+
+    whatsapp._parse_intent_items.cache_clear()
+    first = whatsapp.parse_intent("jobs in Kisumu")
+    first["location"] = "changed"
+    second = whatsapp.parse_intent("jobs in Kisumu")
+
+    assert second["location"] == "Kisumu"
+    assert whatsapp._parse_intent_items.cache_info().hits == 1
+
+
+def test_webhook_reuses_recent_insights_lookup(db_session_factory, monkeypatch):
+    import app.webhooks.whatsapp as whatsapp
+
+    monkeypatch.setattr(settings, "TWILIO_VALIDATE_WEBHOOK_SIGNATURE", False)
+    monkeypatch.setattr(whatsapp, "_lookup_cache", {})
+    calls = []
+
+    def fake_insights(db, location=None):
+        calls.append(location)
+        return {
+            "total_postings": 7,
+            "week_over_week_change": 0,
+            "top_hiring_companies": [],
+            "trending_skills": [],
+        }
+
+    monkeypatch.setattr(whatsapp, "get_weekly_insights", fake_insights)
+
+    app = FastAPI()
+    app.include_router(whatsapp_router, prefix="/whatsapp")
+    app.dependency_overrides[get_db] = lambda: db_session_factory()
+
+    with TestClient(app) as client:
+        first = client.post("/whatsapp/webhook", data={"Body": "market Nairobi"})
+        second = client.post("/whatsapp/webhook", data={"Body": "market Nairobi"})
+
+    assert first.json() == second.json()
+    assert "7 new jobs this week" in first.json()["message"]
+    assert calls == ["Nairobi"]
+
+
+def test_send_whatsapp_message_reuses_twilio_client(monkeypatch):
+    import twilio.rest
+
+    import app.webhooks.whatsapp as whatsapp
+
+    created = []
+
+    class FakeClient:
+        def __init__(self, sid, token):
+            created.append((sid, token))
+            self.messages = self
+
+        def create(self, **kwargs):
+            return type("Message", (), {"sid": "SM1"})()
+
+    monkeypatch.setattr(twilio.rest, "Client", FakeClient)
+    monkeypatch.setattr(whatsapp, "_twilio_client", None)
+    monkeypatch.setattr(settings, "TWILIO_ACCOUNT_SID", "AC123")
+    monkeypatch.setattr(settings, "TWILIO_AUTH_TOKEN", "token")
+    monkeypatch.setattr(settings, "TWILIO_WHATSAPP_FROM", "+14155238886")
+
+    assert whatsapp.send_whatsapp_message_sync("+254700000000", "hi")
+    assert whatsapp.send_whatsapp_message_sync("+254700000001", "hi")
+
+    assert created == [("AC123", "token")]
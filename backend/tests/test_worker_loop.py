@@ -0,0 +1,33 @@
+import threading
+
+from app.tasks.worker_loop import get_worker_loop, run_in_worker_loop
+
+
+def test_tasks_on_different_pool_threads_overlap():
+    # Each coroutine blocks its loop until the other one arrives, like a sync
+    # DB call made from async code; a single shared loop would deadlock here.
+    barrier = threading.Barrier(2, timeout=5)
+    results = []
+
+    async def blocking_task(name):
+        barrier.wait()
+        return name
+
+    threads = [
+        threading.Thread(
+            target=lambda name=name: results.append(
+                run_in_worker_loop(blocking_task(name))
+            )
+        )
+        for name in ("workflow", "scraper")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert sorted(results) == ["scraper", "workflow"]
+
+
+def test_worker_loop_is_reused_within_a_thread():
+    assert get_worker_loop() is get_worker_loop()
@@ -0,0 +1,54 @@
+from app.tasks import workflow_tasks
+
+
+def test_record_event_queues_instead_of_writing(monkeypatch):
+    queued = []
+
+    def fail_session():
+        raise AssertionError("event should not be written inline")
+
+    monkeypatch.setattr(
+        workflow_tasks.record_processing_event,
+        "delay",
+        lambda **event: queued.append(event),
+        raising=False,
+    )
+    monkeypatch.setattr(workflow_tasks, "SessionLocal", fail_session)
+
+    workflow_tasks._record_event(process_type="daily_workflow", status="success")
+
+    assert queued == [{"process_type": "daily_workflow", "status": "success"}]
+
+
+def test_record_event_writes_inline_when_queueing_fails(monkeypatch):
+    written = []
+
+    class FakeSession:
+        def close(self):
+            pass
+
+    def broken_delay(**event):
+        raise ConnectionError("broker down")
+
+    monkeypatch.setattr(
+        workflow_tasks.record_processing_event, "delay", broken_delay, raising=False
+    )
+    monkeypatch.setattr(workflow_tasks, "SessionLocal", FakeSession)
+    monkeypatch.setattr(
+        workflow_tasks,
+        "log_processing_event",
+        lambda db, **event: written.append(event),
+    )
+
+    workflow_tasks._record_event(
+        process_type="daily_insights", status="error", message="boom"
+    )
+
+    assert written == [
+        {
+            "process_type": "daily_insights",
+            "status": "error",
+            "message": "boom",
+            "details": None,
+        }
+    ]